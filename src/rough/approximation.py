@@ -6,13 +6,14 @@ generalization of the lower and upper approximation, which are defined by Pawlak
 book "Rough Sets: Theoretical Aspects of Reasoning About Data".
 """
 
-from collections import namedtuple
+from array import array
+from collections import Counter, namedtuple
 from collections.abc import Iterable
-from typing import List, Union, Set
+from typing import Callable, List, Union, Set, Tuple
 
 import igraph
 
-from rough.granulation import RoughGranulation
+from rough.granulation import QUERY_CACHE_SIZE, RoughGranulation, memoize
 
 
 class RoughApproximation(RoughGranulation):
@@ -23,6 +24,14 @@ class RoughApproximation(RoughGranulation):
     by Pawlak on page 10 of his book "Rough Sets: Theoretical Aspects of Reasoning About Data".
     """
 
+    # the approximations that roughly_equal and roughly_included compare in each mode
+    APPROXIMATIONS_OF_MODE = {
+        "bottom": ("lower_approximation",),
+        "top": ("upper_approximation",),
+        "both": ("lower_approximation", "upper_approximation"),
+    }
+
+    @memoize
     def indiscernibility(self, equivalence_relations: Union[str, set, list]):
         """
         The indiscernibility relation over a vector of equivalence relations (referred to as
@@ -42,6 +51,116 @@ class RoughApproximation(RoughGranulation):
             equivalence relations P, called P-basic knowledge about U (universe) in K (knowledge
             base).
         """
+        if isinstance(equivalence_relations, str):
+            # a single equivalence relation (e.g., "R1"), rather than each of its characters; the
+            # result is cached under the string itself (see memoize), so this is only done once
+            return self.indiscernibility((equivalence_relations,))
+        if self._strategy(equivalence_relations) == "classify":
+            # the elements are grouped by their labels directly, rather than building each block
+            # as a bitmask and then decoding it, which is quadratic in the size of the universe
+            return frozenset(self._classify_items(list(equivalence_relations)))
+        return frozenset(
+            self._items_of(category)
+            for category in self._indiscernibility_masks(equivalence_relations)
+        )
+
+    @memoize
+    def indiscernibility_canonical(
+        self, equivalence_relations: Union[str, set, list]
+    ) -> Tuple[int, ...]:
+        """
+        The indiscernibility relation over a vector of equivalence relations (see
+        indiscernibility) in a canonical form: the sorted bitmasks of its equivalence classes (see
+        _mask_of). Comparing two canonical forms is a single tuple comparison rather than
+        comparing a frozenset of frozensets, though the canonical forms of two RoughApproximation
+        objects are only comparable if their elements were added in the same order.
+
+        Args:
+            equivalence_relations: An iterable of equivalence relations that must be a subset
+            of the available relations and cannot be empty.
+
+        Returns:
+            The sorted bitmasks of the equivalence classes of IND(P).
+        """
+        return tuple(sorted(self._indiscernibility_masks(equivalence_relations)))
+
+    def equivalence_class(
+        self, equivalence_relations: Union[str, set, list], element
+    ) -> frozenset:
+        """
+        The equivalence class of an element x of the universe with respect to IND(P), denoted
+        [x]_P, i.e., the elements that are indiscernible from x given the equivalence relations P
+        (see indiscernibility). If each relation partitions the related elements, the class is
+        looked up by the element's label (see _indiscernibility_index); otherwise, it is the
+        intersection of the categories that contain the element, one per relation.
+
+        Args:
+            equivalence_relations: An iterable of equivalence relations that must be a subset
+            of the available relations and cannot be empty, or a single equivalence relation.
+            element: An element of the universe.
+
+        Returns:
+            The equivalence class of the element, which is empty if the element is not related to
+            any of the equivalence relations.
+        """
+        if isinstance(equivalence_relations, str):
+            equivalence_relations = (equivalence_relations,)
+        _, positions = self._elements()
+        if element not in positions:
+            raise ValueError(f"The element {element} is not in the universe.")
+        position = positions[element]
+        if self._strategy(equivalence_relations) != "intersect":
+            labels, blocks, _ = self._indiscernibility_index(
+                list(equivalence_relations)
+            )
+            return self._items_of(blocks[labels[position]])
+        if not self._related_mask() >> position & 1:
+            return frozenset()
+        return self._items_of(
+            self._class_at(
+                position,
+                [self._relation_masks(relation) for relation in equivalence_relations],
+            )
+        )
+
+    @memoize
+    def _indiscernibility_masks(
+        self, equivalence_relations: Union[str, set, list]
+    ) -> frozenset:
+        """
+        The indiscernibility relation over a vector of equivalence relations (see
+        indiscernibility), where each equivalence class is encoded as a bitmask (see _mask_of).
+
+        Args:
+            equivalence_relations: An iterable of equivalence relations that must be a subset
+            of the available relations and cannot be empty.
+
+        Returns:
+            The bitmasks of the equivalence classes of IND(P).
+        """
+        if isinstance(equivalence_relations, str):
+            return self._indiscernibility_masks((equivalence_relations,))
+        strategy = self._strategy(equivalence_relations)
+        if strategy == "refine":
+            return frozenset(self._refine(list(equivalence_relations)))
+        if strategy == "classify":
+            return frozenset(self._classify(list(equivalence_relations)))
+        return frozenset(self._intersect(equivalence_relations))
+
+    @memoize
+    def _strategy(self, equivalence_relations: Union[str, set, list]) -> str:
+        """
+        Check the equivalence relations, and choose how the equivalence classes of IND(P) are to
+        be found: "refine" (see _refine) or "classify" (see _classify) if each relation partitions
+        the related elements, otherwise "intersect" (see _intersect).
+
+        Args:
+            equivalence_relations: An iterable of equivalence relations that must be a subset
+            of the available relations and cannot be empty.
+
+        Returns:
+            The name of the strategy.
+        """
         if len(equivalence_relations) == 0:
             raise ValueError("The relations' length must be greater than zero.")
 
@@ -49,24 +168,226 @@ class RoughApproximation(RoughGranulation):
         relation_names = frozenset(
             [relation["item"] for relation in possible_relations]
         )
-        if frozenset(equivalence_relations).issubset(relation_names):
-            indiscernibility_relation = set()
-            for element in frozenset(self.select_by_tags(tags="element")["item"]):
-                categories = self[element]
-                if len(categories) > 0:
-                    # it is possible for self[element] to have no equivalence relations
-                    new_category = set(self.select_by_tags(tags="element")["item"])
-                    for relation in equivalence_relations:
-                        if relation in categories:
-                            # some elements might not be defined for all relations
-                            new_category = new_category.intersection(
-                                categories[relation]
-                            )
-                    indiscernibility_relation.add(frozenset(new_category))
-            return indiscernibility_relation
-        raise ValueError(
-            "The relations must be a subset of the existing relations on the graph."
+        if not frozenset(equivalence_relations).issubset(relation_names):
+            raise ValueError(
+                "The relations must be a subset of the existing relations on the graph."
+            )
+        if not all(self._is_partition(relation) for relation in equivalence_relations):
+            return "intersect"
+        items, _ = self._elements()
+        number_of_blocks = 1  # an upper bound on the number of blocks of the partition
+        for relation in equivalence_relations:
+            number_of_blocks *= max(self._relation_labels(relation), default=0) + 1
+        if number_of_blocks < len(items):
+            return "refine"
+        # the partition is likely to be fine, and splitting many small blocks one at a time is
+        # slower than classifying each element by its labels at once
+        return "classify"
+
+    def _intersect(self, equivalence_relations) -> Set[int]:
+        """
+        Intersect the categories that each related element of the universe belongs to with respect
+        to each of the equivalence relations. Each category is encoded as a bitmask over the
+        elements of the universe, so that intersecting them is a bitwise AND (see _mask_of).
+
+        Args:
+            equivalence_relations: A non-empty iterable of equivalence relations.
+
+        Returns:
+            The intersected categories, as bitmasks.
+        """
+        items, _ = self._elements()
+        relation_masks = [
+            self._relation_masks(relation) for relation in equivalence_relations
+        ]
+        related = self._related_mask()
+        categories = set()
+        for position in range(len(items)):
+            if related >> position & 1:
+                categories.add(self._class_at(position, relation_masks))
+        return categories
+
+    def _class_at(self, position: int, relation_masks: List[list]) -> int:
+        """
+        Intersect the categories that the element at the given bit position belongs to with
+        respect to each of the equivalence relations (see _intersect).
+
+        Args:
+            position: The bit position of a related element (see _elements).
+            relation_masks: The bitmask of each element's category with respect to each of the
+            equivalence relations (see _relation_masks).
+
+        Returns:
+            The intersected category, as a bitmask.
+        """
+        items, _ = self._elements()
+        # it is possible for an element to have no equivalence relations
+        category = (1 << len(items)) - 1
+        for masks in relation_masks:
+            if masks[position] is not None:
+                # some elements might not be defined for all relations
+                category &= masks[position]
+        return category
+
+    def _indiscernibility_labels(self, equivalence_relations: list) -> array:
+        """
+        Label each element of the universe with its equivalence class of IND(P), where two
+        elements have the same label if and only if they have the same label with respect to each
+        of the equivalence relations (see _relation_labels). The elements are only iterated by
+        zip and map, so no Python bytecode is executed per element. Only valid if each relation
+        partitions the related elements (see _is_partition).
+
+        Args:
+            equivalence_relations: A non-empty list of equivalence relations.
+
+        Returns:
+            The label of each element's equivalence class.
+        """
+        keys = list(
+            zip(
+                *(self._relation_labels(relation) for relation in equivalence_relations)
+            )
         )
+        label_of = {key: label for label, key in enumerate(dict.fromkeys(keys))}
+        return array("i", map(label_of.__getitem__, keys))
+
+    def _classify(self, equivalence_relations: list) -> List[int]:
+        """
+        Find the blocks of the partition induced by the equivalence relations by labelling each
+        element with its equivalence class (see _indiscernibility_index). Unlike _refine, the
+        cost does not depend on the number of blocks. Only valid if each relation partitions the
+        related elements (see _is_partition).
+
+        Args:
+            equivalence_relations: A non-empty list of equivalence relations.
+
+        Returns:
+            The blocks of the partition induced by the equivalence relations, as bitmasks.
+        """
+        _, blocks, _ = self._indiscernibility_index(equivalence_relations)
+        return [block for block in blocks if block]
+
+    @memoize
+    def _indiscernibility_index(
+        self, equivalence_relations: list
+    ) -> Tuple[array, List[int], List[int]]:
+        """
+        Label each element of the universe with its equivalence class of IND(P) (see
+        _indiscernibility_labels), and map each label to the bitmask and the size of its block, so
+        that the block of an element is found by its bit position rather than by searching the
+        blocks. The elements that are not related to any relation (see _unrelated_label) do not
+        belong to any block, so the bitmask of their label is zero. Only valid if each relation
+        partitions the related elements (see _is_partition).
+
+        Args:
+            equivalence_relations: A non-empty list of equivalence relations.
+
+        Returns:
+            The label of each element, and the bitmask and the size of the block of each label.
+        """
+        labels = self._indiscernibility_labels(equivalence_relations)
+        blocks = [0] * (max(labels, default=-1) + 1)
+        sizes = [0] * len(blocks)
+        for position, label in enumerate(labels):
+            blocks[label] |= 1 << position
+            sizes[label] += 1
+        unrelated = self._unrelated_label(equivalence_relations, labels)
+        if unrelated != -1:
+            blocks[unrelated], sizes[unrelated] = 0, 0
+        return labels, blocks, sizes
+
+    def _unrelated_label(self, equivalence_relations: list, labels: array) -> int:
+        """
+        Find the label (see _indiscernibility_labels) of the elements that are not related to any
+        relation, which are labelled -1 by every relation and do not belong to any block.
+
+        Args:
+            equivalence_relations: A non-empty list of equivalence relations.
+            labels: The label of each element's equivalence class.
+
+        Returns:
+            The label of the unrelated elements, or -1 if every element is related.
+        """
+        first_labels = self._relation_labels(equivalence_relations[0])
+        return labels[first_labels.index(-1)] if -1 in first_labels else -1
+
+    def _classify_items(self, equivalence_relations: list) -> List[frozenset]:
+        """
+        Find the blocks of the partition induced by the equivalence relations as frozensets of
+        elements, by grouping the elements by their labels (see _indiscernibility_labels). Unlike
+        _classify, no bitmasks are built, so the cost is linear in the size of the universe
+        however fine the partition is. Only valid if each relation partitions the related
+        elements (see _is_partition).
+
+        Args:
+            equivalence_relations: A non-empty list of equivalence relations.
+
+        Returns:
+            The blocks of the partition induced by the equivalence relations.
+        """
+        items, _ = self._elements()
+        labels = self._indiscernibility_labels(equivalence_relations)
+        blocks = [[] for _ in range(max(labels, default=-1) + 1)]
+        for item, label in zip(items, labels):
+            blocks[label].append(item)
+        unrelated = self._unrelated_label(equivalence_relations, labels)
+        return [
+            self._intern_block(frozenset(block))
+            for label, block in enumerate(blocks)
+            if label != unrelated
+        ]
+
+    def _refine(self, equivalence_relations: list) -> List[int]:
+        """
+        Refine the partition induced by the first equivalence relation with each of the remaining
+        equivalence relations, by splitting every block into its intersections with the categories
+        of the next relation. A block with a single element cannot be split any further, so it is
+        set aside and not revisited. Only valid if each relation partitions the related elements
+        (see _is_partition).
+
+        Args:
+            equivalence_relations: A non-empty list of equivalence relations.
+
+        Returns:
+            The blocks of the partition induced by the equivalence relations, as bitmasks.
+        """
+        first_masks = self._relation_masks(equivalence_relations[0])
+        singletons, blocks = [], []
+        for block in frozenset(first_masks) - {None}:
+            (blocks if block & (block - 1) else singletons).append(block)
+        for relation in equivalence_relations[1:]:
+            if not blocks:
+                break
+            refined_blocks = []
+            for sub_block in self._split_blocks(blocks, relation):
+                (refined_blocks if sub_block & (sub_block - 1) else singletons).append(
+                    sub_block
+                )
+            blocks = refined_blocks
+        return singletons + blocks
+
+    def _split_blocks(self, blocks: List[int], relation) -> List[int]:
+        """
+        Refine a partition with an equivalence relation, by splitting every block into its
+        intersections with the relation's categories. Only valid if the relation partitions the
+        related elements (see _is_partition).
+
+        Args:
+            blocks: The blocks of the partition, as bitmasks.
+            relation: An equivalence relation.
+
+        Returns:
+            The blocks of the refined partition, as bitmasks.
+        """
+        masks = self._relation_masks(relation)
+        refined_blocks = []
+        for block in blocks:
+            remaining = block
+            while remaining:
+                sub_block = block & masks[(remaining & -remaining).bit_length() - 1]
+                remaining &= ~sub_block
+                refined_blocks.append(sub_block)
+        return refined_blocks
 
     def lower_approximation(
         self,
@@ -85,11 +406,46 @@ class RoughApproximation(RoughGranulation):
         Returns:
             Either a frozenset or a set of frozensets that represent the lower approximation.
         """
+        return self._approximate(relations, categories, self._lower_approximation_of)
+
+    def _lower_approximation_of(
+        self, relations: Union[str, set], category: frozenset
+    ) -> frozenset:
+        """
+        Get the lower approximation of a single category (see lower_approximation). A category
+        with fewer elements than the smallest block of IND(relations) cannot contain any block, so
+        its lower approximation is empty without approximating it.
 
-        return self.approximation(
-            relations,
-            categories,
-            mode=lambda subset, category: subset.issubset(category),
+        Args:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            category: The category (frozenset).
+
+        Returns:
+            A frozenset of the lower approximation.
+        """
+        if len(category) < self._smallest_block_size(relations):
+            return frozenset()
+        return self._items_of(self._approximation_masks(relations, category)[0])
+
+    @memoize
+    def _smallest_block_size(self, relations: Union[str, set]) -> int:
+        """
+        Get the number of elements in the smallest block of IND(relations).
+
+        Args:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+
+        Returns:
+            The size of the smallest block, or zero if there are no blocks.
+        """
+        return min(
+            (
+                bin(block).count("1")
+                for block in self._indiscernibility_masks(relations)
+            ),
+            default=0,
         )
 
     def upper_approximation(
@@ -109,11 +465,70 @@ class RoughApproximation(RoughGranulation):
         Returns:
             Either a frozenset or a set of frozensets that represent the upper approximation.
         """
-        return self.approximation(
-            relations,
-            categories,
-            mode=lambda subset, category: len(subset.intersection(category)) > 0,
-        )
+        return self._approximate(relations, categories, self._upper_approximation_of)
+
+    def _upper_approximation_of(
+        self, relations: Union[str, set], category: frozenset
+    ) -> frozenset:
+        """
+        Get the upper approximation of a single category (see upper_approximation).
+
+        Args:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            category: The category (frozenset).
+
+        Returns:
+            A frozenset of the upper approximation.
+        """
+        return self._items_of(self._approximation_masks(relations, category)[1])
+
+    @memoize(maxsize=QUERY_CACHE_SIZE)
+    def _approximation_masks(
+        self, relations: Union[str, set], category: frozenset
+    ) -> Tuple[int, int]:
+        """
+        Get the lower and upper approximation of a single category as bitmasks (see _mask_of). A
+        block belongs to the upper approximation if it shares an element with the category, and
+        also to the lower approximation if all of its elements are in the category. The boundary
+        region, the negative region and the accuracy of the category are all derived from these
+        two bitmasks.
+
+        If each relation partitions the related elements, the block of each element of the
+        category is looked up by its label (see _indiscernibility_index), and a block is in the
+        category if as many of its elements were counted as it has. Only the blocks that meet the
+        category are visited, and no bitwise AND of two bitmasks is needed. Otherwise, every block
+        of IND(relations) is ANDed with the category once.
+
+        Args:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            category: The category (frozenset).
+
+        Returns:
+            The bitmasks of the lower and upper approximation.
+        """
+        if isinstance(relations, str):
+            relations = (relations,)
+        lower, upper = 0, 0
+        if self._strategy(relations) != "intersect":
+            _, positions = self._elements()
+            labels, blocks, sizes = self._indiscernibility_index(list(relations))
+            for label, count in Counter(
+                labels[positions[item]] for item in category if item in positions
+            ).items():
+                upper |= blocks[label]
+                if count == sizes[label]:
+                    lower |= blocks[label]
+            return lower, upper
+        category_mask = self._mask_of(category)
+        for block in self._indiscernibility_masks(relations):
+            common = block & category_mask
+            if common:
+                upper |= block
+                if common == block:
+                    lower |= block
+        return lower, upper
 
     def approximation(
         self,
@@ -145,7 +560,6 @@ class RoughApproximation(RoughGranulation):
         def __approximation(
             relations: Union[str, set],
             category: frozenset,
-            satisfied_constraint: callable,
         ) -> frozenset:
             """
             Get the approximation of a category.
@@ -153,25 +567,41 @@ class RoughApproximation(RoughGranulation):
             Args:
                 relations: Either a set of relations or a string that references a specific relation
                 in the RoughApproximation.
-                categories: The category (frozenset) or a family of categories (list of frozensets).
-                satisfied_constraint: The constraint that is to be satisfied or otherwise
-                known as the mode of approximation, which is a function that takes two arguments: a
-                subset and a category. The mode function should return True if the subset satisfies
-                the category. In the case of the lower approximation, the mode function should
-                return True if the subset is a subset of the category. In the case of the upper
-                approximation, the mode function should return True if the subset intersects with
-                the category.
+                category: The category (frozenset).
 
             Returns:
                 A frozenset of the approximation.
             """
-            indiscernibility_relation = self.indiscernibility(relations)
-            result = set()
-            for subset in indiscernibility_relation:
-                if satisfied_constraint(subset, category):
-                    result = result.union(subset)
-            return frozenset(result)
+            # the union is taken once, rather than copying the result for each subset
+            return frozenset().union(
+                *(
+                    subset
+                    for subset in self.indiscernibility(relations)
+                    if mode(subset, category)
+                )
+            )
+
+        return self._approximate(relations, categories, __approximation)
+
+    @staticmethod
+    def _approximate(
+        relations: Union[str, set],
+        categories: Union[set, frozenset, List[frozenset]],
+        approximate_category: Callable[[Union[str, set], frozenset], frozenset],
+    ) -> Union[frozenset, Set[frozenset]]:
+        """
+        Check the given (set of) category(s) and approximate each of them (see approximation).
+
+        Args:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            categories: The category (frozenset) or a family of categories (list of frozensets).
+            approximate_category: A function that takes the relations and a single category, and
+            returns the approximation of that category.
 
+        Returns:
+            Either a frozenset or a set of frozensets that represent the approximation.
+        """
         if len(categories) == 0:
             raise ValueError("The argument 'categories' may not have a length of zero.")
         if isinstance(categories, Iterable) and isinstance(categories, list):
@@ -182,9 +612,9 @@ class RoughApproximation(RoughGranulation):
                     raise ValueError(
                         "The argument 'categories' may not have an element with a length of zero."
                     )
-                result.add(__approximation(relations, category, mode))
+                result.add(approximate_category(relations, category))
         elif isinstance(categories, (set, frozenset)):
-            result = __approximation(relations, categories, mode)
+            result = approximate_category(relations, categories)
         else:
             raise ValueError(
                 "The argument 'categories' must be a set, a frozenset, or a list."
@@ -192,24 +622,8 @@ class RoughApproximation(RoughGranulation):
 
         return frozenset(result)
 
-    def positive_region(
-        self,
-        relations: Union[str, set],
-        categories: Union[set, frozenset, List[frozenset]],
-    ) -> Union[frozenset, Set[frozenset]]:
-        """
-        Analogous to the R-lower approximation.
-
-        Args:
-            relations: Either a set of relations or a string that references a specific relation
-            in the RoughApproximation.
-            categories: The category (frozenset) or a family of categories (list of frozensets).
-
-        Returns:
-            Either a frozenset or a set of frozensets that represent the positive region or
-            the lower approximation.
-        """
-        return self.lower_approximation(relations, categories)
+    # the positive region is the R-lower approximation, so the same method serves both
+    positive_region = lower_approximation
 
     def negative_region(
         self, relations: Union[str, set], categories: Union[frozenset, List[frozenset]]
@@ -228,6 +642,11 @@ class RoughApproximation(RoughGranulation):
         Returns:
             Either a frozenset or a set of frozensets that represent the negative region.
         """
+        if isinstance(categories, (set, frozenset)) and categories:
+            # a single category: the complement of its upper approximation, as bitmasks
+            items, _ = self._elements()
+            _, upper = self._approximation_masks(relations, categories)
+            return self._items_of(((1 << len(items)) - 1) & ~upper)
         return frozenset(
             self.select_by_tags(tags="element")["item"]
         ) - self.upper_approximation(relations, categories)
@@ -250,6 +669,10 @@ class RoughApproximation(RoughGranulation):
         Returns:
             Either a frozenset or a set of frozensets that represent the boundary region.
         """
+        if isinstance(categories, (set, frozenset)) and categories:
+            # a single category: the blocks of its upper approximation that are not in its lower
+            lower, upper = self._approximation_masks(relations, categories)
+            return self._items_of(upper & ~lower)
         return self.upper_approximation(
             relations, categories
         ) - self.lower_approximation(relations, categories)
@@ -285,6 +708,10 @@ class RoughApproximation(RoughGranulation):
         """
         lower_approximation = self.lower_approximation(relations, category)
         upper_approximation = self.upper_approximation(relations, category)
+        items, _ = self._elements()
+        # the approximations are only computed once, and the universe is decoded from its bitmask
+        # (see _items_of) rather than collected from the graph for each comparison
+        is_universe = upper_approximation == self._items_of((1 << len(items)) - 1)
 
         if lower_approximation == upper_approximation:
             # The set X is called R-definable if X is the union of some R-basic categories;
@@ -293,40 +720,24 @@ class RoughApproximation(RoughGranulation):
             return namedtuple(
                 "Definable", ["lower_approximation", "upper_approximation"]
             )(lower_approximation, upper_approximation)
-        if len(
-            self.lower_approximation(relations, category)
-        ) > 0 and self.upper_approximation(relations, category) != frozenset(
-            self.select_by_tags(tags="element")["item"]
-        ):
+        if len(lower_approximation) > 0 and not is_universe:
             # We are able to decide whether some elements of the universe belong to X or not X.
             return namedtuple(
                 "RoughlyDefinable", ["lower_approximation", "upper_approximation"]
             )(lower_approximation, upper_approximation)
-        if len(
-            self.lower_approximation(relations, category)
-        ) == 0 and self.upper_approximation(relations, category) != frozenset(
-            self.select_by_tags(tags="element")["item"]
-        ):
+        if len(lower_approximation) == 0 and not is_universe:
             # We are able to decide whether some elements of the universe belong to not X,
             # but we are unable to indicate one element of X.
             return namedtuple(
                 "InternallyUndefinable", ["lower_approximation", "upper_approximation"]
             )(lower_approximation, upper_approximation)
-        if len(
-            self.lower_approximation(relations, category)
-        ) != 0 and self.upper_approximation(relations, category) == frozenset(
-            self.select_by_tags(tags="element")["item"]
-        ):
+        if len(lower_approximation) != 0 and is_universe:
             # We are able to decide for some elements of the universe whether they belong to X,
             # but we are unable to indicate one element of not X.
             return namedtuple(
                 "ExternallyUndefinable", ["lower_approximation", "upper_approximation"]
             )(lower_approximation, upper_approximation)
-        if len(
-            self.lower_approximation(relations, category)
-        ) == 0 and self.upper_approximation(relations, category) == frozenset(
-            self.select_by_tags(tags="element")["item"]
-        ):
+        if len(lower_approximation) == 0 and is_universe:
             # We are unable to decide for any element of the universe whether
             # it belongs to X or not X.
             return namedtuple(
@@ -362,7 +773,7 @@ class RoughApproximation(RoughGranulation):
                 numerator += len(self.lower_approximation(relations, category))
         else:
             numerator = len(self.lower_approximation(relations, categories))
-        denominator = len(frozenset(self.select_by_tags(tags="element")["item"]))
+        denominator = len(self._elements()[0])
 
         return numerator / denominator
 
@@ -399,20 +810,10 @@ class RoughApproximation(RoughGranulation):
             Whether the category and the other category are roughly equal given knowledge about
             "relations".
         """
-        if mode == "bottom":
-            return self.lower_approximation(
-                relations, category
-            ) == self.lower_approximation(relations, other_category)
-        if mode == "top":
-            return self.upper_approximation(
-                relations, category
-            ) == self.upper_approximation(relations, other_category)
-        if mode == "both":
-            return self.roughly_equal(
-                relations, category, other_category, mode="bottom"
-            ) and self.roughly_equal(relations, category, other_category, mode="top")
-
-        raise ValueError("The argument 'mode' is not valid.")
+        return all(
+            approximate(relations, category) == approximate(relations, other_category)
+            for approximate in self.__approximations_of(mode)
+        )
 
     def roughly_included(
         self,
@@ -450,20 +851,32 @@ class RoughApproximation(RoughGranulation):
             Whether the category is roughly included in (i.e., a subset of) the other category
             given knowledge about "relations".
         """
-        if mode == "bottom":
-            return self.lower_approximation(relations, category).issubset(
-                self.lower_approximation(relations, other_category)
+        return all(
+            approximate(relations, category).issubset(
+                approximate(relations, other_category)
             )
-        if mode == "top":
-            return self.upper_approximation(relations, category).issubset(
-                self.upper_approximation(relations, other_category)
-            )
-        if mode == "both":
-            return self.roughly_included(
-                relations, category, other_category, mode="bottom"
-            ) and self.roughly_included(relations, category, other_category, mode="top")
+            for approximate in self.__approximations_of(mode)
+        )
 
-        raise ValueError("The argument 'mode' is not valid.")
+    def __approximations_of(self, mode: str) -> Tuple[Callable, ...]:
+        """
+        A helper method for roughly_equal() and roughly_included() that gets the approximations
+        that are compared in the given mode (see APPROXIMATIONS_OF_MODE).
+
+        Args:
+            mode: The mode of equality or inclusion.
+
+        Returns:
+            The approximation methods.
+        """
+        try:
+            names = self.APPROXIMATIONS_OF_MODE[mode]
+        except (
+            KeyError,
+            TypeError,
+        ) as exception:  # e.g., an unknown or unhashable mode
+            raise ValueError("The argument 'mode' is not valid.") from exception
+        return tuple(getattr(self, name) for name in names)
 
     def accuracy(self, relations, category):
         """
@@ -475,39 +888,64 @@ class RoughApproximation(RoughGranulation):
         it is R-undefinable (i.e., our knowledge is incomplete).
 
         Args:
-            relations:
-            category:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            category: The category (frozenset) or a family of categories (list of frozensets).
 
         Returns:
-
+            The size of the lower approximation divided by the size of the upper approximation
+            (summed over the family of categories, if a list is given).
         """
         if len(category) == 0:
             raise ValueError("The argument 'category' may not have a length of zero.")
         if isinstance(category, Iterable) and isinstance(category, list):
             # category is a family of non-empty sets
-            numerator, denominator = 0.0, 0.0
+            numerator, denominator = 0, 0
             for set_x_i in category:
                 if len(set_x_i) == 0:
                     raise ValueError(
                         "The argument 'category' may not have an element with a length of zero."
                     )
-                numerator += len(self.lower_approximation(relations, set_x_i))
-                denominator += len(self.upper_approximation(relations, set_x_i))
+                lower_size, upper_size = self.__approximation_sizes(relations, set_x_i)
+                numerator += lower_size
+                denominator += upper_size
         else:
-            numerator = len(self.lower_approximation(relations, category))
-            denominator = len(self.upper_approximation(relations, category))
+            numerator, denominator = self.__approximation_sizes(relations, category)
         return numerator / denominator
 
+    def __approximation_sizes(self, relations, category) -> Tuple[int, int]:
+        """
+        A helper method for accuracy() that gets the sizes of the lower and upper approximation
+        of a category. The elements of a single category's approximations are counted from their
+        bitmasks (see _approximation_masks) without being decoded.
+
+        Args:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            category: The category (frozenset).
+
+        Returns:
+            The sizes of the lower and upper approximation.
+        """
+        if isinstance(category, (set, frozenset)):
+            lower, upper = self._approximation_masks(relations, category)
+            return bin(lower).count("1"), bin(upper).count("1")
+        return len(self.lower_approximation(relations, category)), len(
+            self.upper_approximation(relations, category)
+        )
+
     def roughness(self, relations, category):
         """
         The complement of a rough set's accuracy or inexactness; represents
         the degree of incompleteness of knowledge 'relations' about the set X.
 
         Args:
-            relations:
-            category:
+            relations: Either a set of relations or a string that references a specific relation
+            in the RoughApproximation.
+            category: The category (frozenset) or a family of categories (list of frozensets).
 
         Returns:
-
+            One minus the accuracy of the category (see accuracy), which shares its cached
+            approximations rather than computing them again.
         """
         return 1 - self.accuracy(relations, category)
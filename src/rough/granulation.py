@@ -4,13 +4,128 @@ granulation operations required for rough set theory. This class is inherited by
 classes, such as RoughApproximation, to provide the basic granulation operations.
 """
 
-from typing import Union, Dict, Set, Any, List
+from typing import Union, Dict, Set, Any, List, Tuple, Optional, Callable, Hashable
 from collections.abc import Iterable
-from collections import Counter
+from collections import Counter, OrderedDict
+from functools import wraps
+from itertools import compress
+from array import array
+import sys
 
 import graphviz
 import igraph as ig
 
+# translate between a packed array of bits (one byte per element, 0 or 1) and binary digits
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+# the number of results kept by the caches that grow with each distinct query (e.g., with each
+# category that is approximated), rather than with the graph
+QUERY_CACHE_SIZE = 1024
+
+
+def relations_key(relations: Any) -> Hashable:
+    """
+    Get an order-independent, hashable form of a (collection of) relation(s), so that e.g.,
+    {"P", "Q"}, ["Q", "P"] and frozenset({"P", "Q"}) refer to the same cached result. Strings and
+    other non-iterable arguments are returned as-is.
+
+    Args:
+        relations: A relation or a collection of relations.
+
+    Returns:
+        A hashable key for the relation(s).
+    """
+    if isinstance(relations, Iterable) and not isinstance(relations, str):
+        return frozenset(relations)
+    return relations
+
+
+def pack_bits(bits: Union[bytes, bytearray]) -> int:
+    """
+    Convert a packed array of bits, with one byte (0 or 1) per element of the universe, to the
+    bitmask of the elements whose byte is 1 (see RoughGranulation._mask_of), in a single int
+    conversion rather than by setting each bit of a wider int in turn.
+
+    Args:
+        bits: The byte of each element, in the order of the elements.
+
+    Returns:
+        The bitmask of the elements.
+    """
+    return int(bits.translate(_TO_DIGITS)[::-1], 2) if bits else 0
+
+
+def lru_lookup(
+    cache: OrderedDict, key: Hashable, compute: Callable[[], Any], maxsize: int
+) -> Any:
+    """
+    Get the value of the key from the cache, or compute and store it if it is missing. Once the
+    cache holds more than maxsize values, the least recently used value is discarded.
+
+    Args:
+        cache: The cache.
+        key: The key of the value.
+        compute: A function (without arguments) that computes the value.
+        maxsize: The largest number of values that the cache may hold.
+
+    Returns:
+        The value of the key.
+    """
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    value = cache[key] = compute()
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+    return value
+
+
+def memoize(
+    method: Optional[Callable] = None, *, maxsize: Optional[int] = None
+) -> Callable:
+    """
+    Cache the result of a method of RoughGranulation (or its subclasses) per argument, until the
+    graph is modified. Arguments are made hashable with relations_key, so this is only meant for
+    methods whose arguments are (collections of) relations or other hashable values (e.g., a
+    mode such as self.indiscernibility) and whose result does not depend on the order of the
+    relations.
+
+    If maxsize is given (i.e., @memoize(maxsize=...)), at most maxsize results of the method are
+    kept, and the least recently used result is discarded first (see lru_lookup). This is meant
+    for methods that are called with a category, as there is a result per distinct query.
+
+    Args:
+        method: The method to cache.
+        maxsize: The largest number of results of the method to keep, or None for no limit.
+
+    Returns:
+        The cached method.
+    """
+    if method is None:
+        return lambda method: memoize(method, maxsize=maxsize)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            method.__qualname__,
+            tuple(relations_key(arg) for arg in args),
+            frozenset((name, relations_key(arg)) for name, arg in kwargs.items()),
+        )
+        # pylint: disable=protected-access
+        if maxsize is not None:
+            return lru_lookup(
+                self._derived.setdefault(method.__qualname__, OrderedDict()),
+                key,
+                lambda: method(self, *args, **kwargs),
+                maxsize,
+            )
+        if key not in self._derived:
+            self._derived[key] = method(self, *args, **kwargs)
+        return self._derived[key]
+
+    return wrapper
+
 
 class RoughGranulation:
     """
@@ -23,8 +138,29 @@ class RoughGranulation:
         self.graph = ig.Graph(directed=True)
         # keys: hashed frozenset or attribute name (if given) mapped to attribute values
         self.attribute_table = {}
+        # structures derived from the graph (e.g., the bit position of each element); these are
+        # built on demand and discarded whenever the graph is modified
+        self._derived = {}
+        # the canonical object of each block (i.e., category) given to add_parent_relation, so that
+        # equal blocks are the same object across relations; the graph only grows, so this is
+        # bounded by its categories
+        self._block_pool = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the derived structures are rebuilt on demand, so only the graph needs to be pickled
+        state = self.__dict__.copy()
+        state["_derived"], state["_block_pool"] = {}, {}
+        return state
 
     def __getitem__(self, item: Union[str, int]) -> Dict[str, list]:
+        categories_of = self._categories_of()
+        if item in categories_of:
+            return {
+                relation: categories[0] if len(categories) == 1 else list(categories)
+                for relation, categories in categories_of[item].items()
+            }
+
+        # the item is not in any category (e.g., it is a relation), so search the graph instead
         vertex = self.graph.vs.find(item_eq=item)
         neighbor_vertices = self.graph.vs[self.graph.neighbors(vertex)]
 
@@ -49,7 +185,19 @@ class RoughGranulation:
                 results[relation] = results[relation][0]
         return results
 
+    @memoize
     def __div_helper(self, other) -> frozenset:
+        """
+        Get the equivalence classes of a single relation (see __truediv__). They are cached until
+        the graph is modified (see memoize), as the graph is otherwise searched for the relation's
+        categories on every call.
+
+        Args:
+            other: A relation.
+
+        Returns:
+            A frozenset of equivalence classes, where each class is a frozenset.
+        """
         categories = []
         # the neighbors of this vertex are the equivalence classes
         equivalence_vertices = self.graph.vs.select(item_eq=other)
@@ -57,7 +205,7 @@ class RoughGranulation:
             nodes = self.graph.predecessors(category.index)
             vertices = self.graph.vs.select(nodes)
             elements = [vertex["item"] for vertex in vertices]
-            categories.append(frozenset(elements))
+            categories.append(self._intern_block(frozenset(elements)))
         return frozenset(categories)
 
     def __truediv__(
@@ -131,6 +279,8 @@ class RoughGranulation:
             assert all(
                 isinstance(tag, set) for tag in tags
             ), "Items in 'tags' must be sets."
+        # the same element (e.g., 'x1') is then the same object wherever it is referenced
+        items = [sys.intern(item) if isinstance(item, str) else item for item in items]
         self.graph.add_vertices(
             len(items),
             attributes={
@@ -139,6 +289,7 @@ class RoughGranulation:
                 **kwargs,
             },
         )
+        self._invalidate()
 
     def create_compound_edges(self, args, target_vertices) -> list:
         """
@@ -180,9 +331,7 @@ class RoughGranulation:
         """
         if not isinstance(source, ig.Vertex):  # if the source is not a vertex
             try:
-                source_vertex = self.graph.vs.find(
-                    item_eq=source
-                )  # try to find its vertex
+                source_vertex = self._find_vertex(source)  # try to find its vertex
             except ValueError as exception:  # no such vertex;
                 raise ValueError(
                     f"A vertex could not be found in the graph: {source}."
@@ -192,9 +341,7 @@ class RoughGranulation:
         try:
             for target in targets:
                 if not isinstance(target, ig.Vertex):  # if the source is not a vertex
-                    target_vertex = self.graph.vs.find(
-                        item_eq=target
-                    )  # try to find its vertex
+                    target_vertex = self._find_vertex(target)  # try to find its vertex
                 else:
                     target_vertex = target
 
@@ -202,6 +349,28 @@ class RoughGranulation:
         except TypeError:  # the "targets" is already a target vertex
             edges.append((source_vertex.index, targets.index))
 
+    def _find_vertex(self, item: Any) -> ig.Vertex:
+        """
+        Find the (first) vertex of the graph whose 'item' is the given item, like
+        self.graph.vs.find(item_eq=item), but with a dictionary of the vertex of each item that
+        is kept with the derived structures, rather than by searching every vertex.
+
+        Args:
+            item: The item of the vertex.
+
+        Returns:
+            The vertex.
+        """
+        if "vertex of" not in self._derived:
+            vertex_of = {}
+            for index, vertex_item in enumerate(self.graph.vs["item"]):
+                if isinstance(vertex_item, Hashable):
+                    vertex_of.setdefault(vertex_item, index)
+            self._derived["vertex of"] = vertex_of
+        if isinstance(item, Hashable) and item in self._derived["vertex of"]:
+            return self.graph.vs[self._derived["vertex of"][item]]
+        return self.graph.vs.find(item_eq=item)  # e.g., an item that is not hashable
+
     def add_parent_relation(self, attr_type, args) -> list:
         """
         Add a relation (attr_type) that references the provided items (args).
@@ -209,18 +378,39 @@ class RoughGranulation:
         Args:
             attr_type: The type of the relation, this can be a callable function as well
             (e.g., AlgebraicProduct).
-            args: A collection of lists, where each element in the collection (a list),
-            stores the 'type' of the vertex in the graph.
+            args: A collection of blocks (e.g., sets or lists), where each block stores the 'item'
+            of the vertices in the graph. A block that is repeated (i.e., with the same items, such
+            as ['a'] and {'a'}) is only added once.
 
         Returns:
-            A list of vertices that represent the parent relationships.
+            A list of vertices that represent the parent relationships, one per distinct block
+            (rather than one per block in args).
         """
         if isinstance(attr_type, str) and str.isdigit(attr_type):
             attr_type = int(attr_type)  # for saving/loading purposes
 
+        # a repeated block (i.e., with the same items) is skipped, and the items of each block are
+        # pooled so that equal blocks are the same object across relations; the edges are still
+        # made from the block as given, so repeated items keep their weight (and order)
+        compounds, seen_blocks = [], set()
+        for compound in args:
+            if isinstance(compound, Iterable) and not isinstance(compound, str):
+                try:
+                    block = frozenset(compound)
+                except TypeError:  # an item is not hashable, so the block is not pooled
+                    block = None
+                if block is not None:
+                    block = self._block_pool.setdefault(block, block)
+                    if block in seen_blocks:
+                        continue
+                    seen_blocks.add(block)
+            compounds.append(compound)
+        args = compounds
+
         vertices = []
         for _ in range(len(args)):
             vertices.append(self.graph.add_vertex(item=attr_type, tags={"relation"}))
+        self._invalidate()
 
         edges = self.create_compound_edges(args, vertices)
         self.add_weighted_edges(edges)
@@ -243,6 +433,258 @@ class RoughGranulation:
             unique_edges_and_frequencies.values(),
         )
         self.graph.add_edges(es=unique_edges, attributes={"weight": list(frequencies)})
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        Discard the structures derived from the graph (e.g., the bit position of each element),
+        as the graph has been modified. They are rebuilt the next time they are needed.
+
+        Returns:
+            None
+        """
+        self._derived.clear()
+
+    def _elements(self) -> Tuple[tuple, Dict[Any, int]]:
+        """
+        Get the elements of the universe (i.e., the items of the vertices tagged 'element') in the
+        order they were added, along with the bit position assigned to each element. A category of
+        elements can then be encoded as an int, where the i'th bit is set if and only if the i'th
+        element belongs to the category.
+
+        Returns:
+            The elements (tuple) and a dictionary that maps each element to its bit position.
+        """
+        if "elements" not in self._derived:
+            items = tuple(dict.fromkeys(self.select_by_tags(tags="element")["item"]))
+            self._derived["elements"] = (
+                items,
+                {item: position for position, item in enumerate(items)},
+            )
+        return self._derived["elements"]
+
+    def _categories_of(self) -> Dict[Any, Dict[Any, List[frozenset]]]:
+        """
+        Map each item to the categories that contain it, per relation, so that the categories of
+        an item (see __getitem__) are a dictionary lookup rather than a search of every category.
+
+        Returns:
+            A dictionary that maps each item to a dictionary, which maps each relation to the
+            categories of that relation that contain the item.
+        """
+        if "categories of" not in self._derived:
+            categories_of = {}
+            for relation in dict.fromkeys(self.select_by_tags(tags="relation")["item"]):
+                for category in self / relation:
+                    for item in category:
+                        categories_of.setdefault(item, {}).setdefault(
+                            relation, []
+                        ).append(category)
+            self._derived["categories of"] = categories_of
+        return self._derived["categories of"]
+
+    def _mask_of(self, items: Iterable) -> int:
+        """
+        Encode the given items as an int, where each bit that is set refers to an element of the
+        universe. Any item that is not an element of the universe is ignored.
+
+        Args:
+            items: The items to encode.
+
+        Returns:
+            The bitmask of the items.
+        """
+        elements, positions = self._elements()
+        found = [positions[item] for item in items if item in positions]
+        if 8 * len(found) < len(elements) or not found:
+            # a sparse category; setting each bit is cheaper than packing the whole universe
+            mask = 0
+            for position in found:
+                mask |= 1 << position
+            return mask
+        # otherwise, pack the bits into one byte per element and convert them to an int at once,
+        # rather than building a wider int for each element
+        bits = bytearray(len(elements))
+        for position in found:
+            bits[position] = 1
+        return pack_bits(bits)
+
+    def _items_of(self, mask: int) -> frozenset:
+        """
+        Decode a bitmask (see _mask_of) back to the elements of the universe it refers to. The
+        blocks of the most recently decoded bitmasks are kept (see QUERY_CACHE_SIZE).
+
+        Args:
+            mask: The bitmask to decode.
+
+        Returns:
+            The elements that the bitmask refers to.
+        """
+        return lru_lookup(
+            self._derived.setdefault("blocks by mask", OrderedDict()),
+            mask,
+            lambda: self._intern_block(self._decode_mask(mask)),
+            QUERY_CACHE_SIZE,
+        )
+
+    def _decode_mask(self, mask: int) -> frozenset:
+        """
+        A helper method to self._items_of that decodes a bitmask without caching the result.
+
+        Args:
+            mask: The bitmask to decode.
+
+        Returns:
+            The elements that the bitmask refers to.
+        """
+        items, _ = self._elements()
+        digits = bin(mask)
+        if 32 * digits.count("1") < len(digits):
+            # a sparse bitmask; clearing one bit at a time is cheaper than unpacking all
+            result, remaining = [], mask
+            while remaining:
+                lowest_bit = remaining & -remaining
+                result.append(items[lowest_bit.bit_length() - 1])
+                remaining ^= lowest_bit
+        else:
+            # unpack the binary digits (least significant first) into one byte per element,
+            # and select the elements whose byte is set
+            result = compress(items, digits[:1:-1].encode().translate(_TO_BITS))
+        return frozenset(result)
+
+    def _intern_block(self, block: frozenset) -> frozenset:
+        """
+        Get the canonical object for the given block (i.e., category) of elements, so that equal
+        blocks are the same object (and their hash is only calculated once). A block that was not
+        given to add_parent_relation (e.g., an approximation) is pooled with the derived
+        structures, so that it is discarded once the graph is modified, and only the most recently
+        used of these are kept (see QUERY_CACHE_SIZE).
+
+        Args:
+            block: A block of elements.
+
+        Returns:
+            The canonical object that is equal to the block.
+        """
+        if block in self._block_pool:
+            return self._block_pool[block]
+        # an ordinary dict that is discarded with the derived structures; a
+        # weakref.WeakValueDictionary of {block: block} would never free a block, as each value is
+        # kept alive by its own key
+        return lru_lookup(
+            self._derived.setdefault("block pool", OrderedDict()),
+            block,
+            lambda: block,
+            QUERY_CACHE_SIZE,
+        )
+
+    def _relation_masks(self, relation) -> List[Optional[int]]:
+        """
+        Get the bitmask of the category that each element of the universe belongs to with respect
+        to the given relation. The i'th entry refers to the i'th element (see _elements), and is
+        None if the element belongs to none of the relation's categories, or zero if the element
+        belongs to more than one of them (i.e., the relation is not an equivalence relation).
+
+        Args:
+            relation: A relation.
+
+        Returns:
+            The bitmask of each element's category with respect to the relation.
+        """
+        key = ("relation masks", relation)
+        if key not in self._derived:
+            self._derived[key] = self._element_blocks(
+                self._mask_of(category) for category in self / relation
+            )
+        return self._derived[key]
+
+    def _relation_labels(self, relation) -> array:
+        """
+        Get the label of the category that each element of the universe belongs to with respect
+        to the given relation, as a compact array of ints (see _relation_masks). Two elements are
+        in the same category if and only if they have the same non-negative label; the label is
+        -1 if the element belongs to none of the relation's categories, or -2 if it belongs to
+        more than one of them.
+
+        Args:
+            relation: A relation.
+
+        Returns:
+            The label of each element's category with respect to the relation.
+        """
+        key = ("relation labels", relation)
+        if key not in self._derived:
+            label_of = {None: -1, 0: -2}
+            self._derived[key] = array(
+                "i",
+                (
+                    label_of.setdefault(mask, len(label_of) - 2)
+                    for mask in self._relation_masks(relation)
+                ),
+            )
+        return self._derived[key]
+
+    def _element_blocks(self, categories: Iterable[int]) -> List[Optional[int]]:
+        """
+        Map each element of the universe to the category (bitmask) that it belongs to, so that
+        the category of an element can be looked up by its bit position (see _elements) rather
+        than by searching the categories. The i'th entry is None if the i'th element belongs to
+        none of the categories, or zero if it belongs to more than one of them.
+
+        Args:
+            categories: The bitmasks of the categories.
+
+        Returns:
+            The bitmask of each element's category.
+        """
+        items, _ = self._elements()
+        masks: List[Optional[int]] = [None] * len(items)
+        for category in categories:
+            remaining = category
+            while remaining:
+                lowest_bit = remaining & -remaining
+                position = lowest_bit.bit_length() - 1
+                masks[position] = category if masks[position] is None else 0
+                remaining ^= lowest_bit
+        return masks
+
+    def _is_partition(self, relation) -> bool:
+        """
+        Determine whether the given relation partitions the related elements of the universe
+        (see _related_mask), i.e., each of them belongs to exactly one of the relation's
+        categories.
+
+        Args:
+            relation: A relation.
+
+        Returns:
+            True if the relation's categories partition the related elements, False otherwise.
+        """
+        key = ("is partition", relation)
+        if key not in self._derived:
+            related = self._related_mask()
+            self._derived[key] = all(
+                mask if related >> position & 1 else True
+                for position, mask in enumerate(self._relation_masks(relation))
+            )
+        return self._derived[key]
+
+    def _related_mask(self) -> int:
+        """
+        Get the bitmask of the elements of the universe that belong to at least one category of
+        some relation.
+
+        Returns:
+            The bitmask of the related elements.
+        """
+        if "related" not in self._derived:
+            related = 0
+            for relation in frozenset(self.select_by_tags(tags="relation")["item"]):
+                for position, mask in enumerate(self._relation_masks(relation)):
+                    if mask is not None:
+                        related |= 1 << position
+            self._derived["related"] = related
+        return self._derived["related"]
 
     def export_visual(self, filename, file_format="png", engine="dot") -> None:
         """
@@ -279,6 +721,24 @@ class RoughGranulation:
                 f"Please select a permitted format: {file_formats}."
             )
 
+    def __family(self, relative_to: set) -> List[frozenset]:
+        """
+        A helper method for family_intersection() and family_union() that gets the set (i.e.,
+        category) of each relation. A relation with more than one category refers to the union
+        of its categories.
+
+        Args:
+            relative_to: A selection of relations.
+
+        Returns:
+            The set of each relation.
+        """
+        return [
+            frozenset().union(*categories)
+            for categories in (self / relative_to).values()
+        ]
+
+    @memoize
     def family_intersection(self, relative_to: set) -> frozenset:
         """
         Get the intersection of a family of sets/categories 'relative_to' some set of relations.
@@ -290,11 +750,9 @@ class RoughGranulation:
             The family intersection.
         """
 
-        categories = [
-            next(iter(category)) for category in (self / relative_to).values()
-        ]
-        return frozenset.intersection(*categories)
+        return frozenset.intersection(*self.__family(relative_to))
 
+    @memoize
     def family_union(self, relative_to: set) -> frozenset:
         """
         Get the union of a family of sets/categories 'relative_to' some set of relations.
@@ -305,10 +763,7 @@ class RoughGranulation:
         Returns:
             The family union.
         """
-        categories = [
-            next(iter(category)) for category in (self / relative_to).values()
-        ]
-        return frozenset.union(*categories)
+        return frozenset.union(*self.__family(relative_to))
 
     def edges(self, relation: str) -> Set[frozenset]:
         """
@@ -2,11 +2,15 @@
 Implements the methods required to work with rough theory.
 """
 
+from collections import Counter
 from collections.abc import Iterable
-from typing import Union, Tuple, List
-from itertools import chain, combinations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, Tuple, List, Set, Optional
+from itertools import chain, combinations, repeat
+from heapq import heapify, heappop, heappush
 
 from rough.approximation import RoughApproximation
+from rough.granulation import memoize, pack_bits
 
 
 def powerset(iterable: Iterable, min_items: int):
@@ -27,6 +31,80 @@ def powerset(iterable: Iterable, min_items: int):
     )
 
 
+def minimal_transversals(clauses: Iterable[int]) -> Set[int]:
+    """
+    Get the minimal transversals (i.e., minimal hitting sets) of a family of sets, where each set
+    is encoded as an int whose bits are its members. A transversal intersects every set, and is
+    minimal if none of its proper subsets is a transversal.
+
+    Args:
+        clauses: The family of sets (bitmasks); none of them may be zero.
+
+    Returns:
+        The minimal transversals (bitmasks).
+    """
+    transversals = {0}
+    for clause in sorted(clauses, key=lambda clause: bin(clause).count("1")):
+        candidates = set()
+        for transversal in transversals:
+            if transversal & clause:
+                candidates.add(transversal)
+                continue
+            remaining = clause
+            while remaining:
+                bit = remaining & -remaining
+                candidates.add(transversal | bit)
+                remaining ^= bit
+        transversals = {
+            candidate
+            for candidate in candidates
+            if not any(
+                other != candidate and other & candidate == other
+                for other in candidates
+            )
+        }
+    return transversals
+
+
+# the knowledge base of a worker process of RoughOperations.find_core_parallel
+_WORKER = {}
+
+
+def _initialize_worker(knowledge_base: "RoughOperations") -> None:
+    """
+    Keep the knowledge base in a worker process of RoughOperations.find_core_parallel, so that
+    it is only sent to (and unpickled by) each worker once, rather than once per task.
+
+    Args:
+        knowledge_base: The knowledge base.
+
+    Returns:
+        None
+    """
+    _WORKER["knowledge base"] = knowledge_base
+
+
+def _indispensable(
+    relations: frozenset, relative_to: Optional[set], relation: str
+) -> bool:
+    """
+    Determine whether the relation is indispensable in the relations, with respect to the
+    knowledge base of the worker process (see _initialize_worker).
+
+    Args:
+        relations: The set of relations.
+        relative_to: The set of relations to find the relative positive region, or None.
+        relation: The relation.
+
+    Returns:
+        True if the relation is indispensable, False otherwise.
+    """
+    knowledge_base = _WORKER["knowledge base"]
+    return not knowledge_base.dispensable(
+        relations, {relation}, relative_to, mode=knowledge_base.indiscernibility
+    )
+
+
 class RoughOperations(RoughApproximation):
     """
     This class implements several methods that are relevant to working with rough set theory.
@@ -105,6 +183,7 @@ class RoughOperations(RoughApproximation):
 
     # begin of metrics methods
 
+    @memoize
     def dispensable(
         self,
         relations: Union[set, frozenset],
@@ -126,6 +205,20 @@ class RoughOperations(RoughApproximation):
             True if dispensable, False otherwise.
         """
         if relative_to is None:
+            # pylint: disable=comparison-with-callable
+            if mode == self.indiscernibility:
+                # compare the equivalence classes without decoding them from their bitmasks
+                classes = self._indiscernibility_masks(relations)
+                other_classes = self._indiscernibility_masks(
+                    relations - frozenset(relation)
+                )
+                if len(classes) != len(other_classes):
+                    return False
+                # if the relations partition the related elements, then IND(relations) refines
+                # the other, so having as many equivalence classes means that they are equal
+                return (
+                    self._strategy(relations) != "intersect" or classes == other_classes
+                )
             try:
                 return mode(relations, relative_to) == mode(
                     relations - frozenset(relation), relative_to
@@ -136,12 +229,10 @@ class RoughOperations(RoughApproximation):
             if relation in relations or (
                 isinstance(relation, set)
                 and len(relation) == 1
-                and relation.intersection(relations)
+                and not relation.isdisjoint(relations)
             ):
-                return self.find_relative_positive_region(
-                    relations, relative_to
-                ) == self.find_relative_positive_region(
-                    relations - set(relation), relative_to
+                return self._preserves_positive_region(
+                    relations, relations - set(relation), relative_to
                 )
             raise ValueError("The 'relation' must be an element of 'relations'.")
 
@@ -206,7 +297,7 @@ class RoughOperations(RoughApproximation):
             possible_reducts = [
                 frozenset(reduct)
                 for reduct in possible_reducts
-                if len(frozenset(reduct).intersection(indispensables)) > 0
+                if not indispensables.isdisjoint(reduct)
             ]
         try:
             target_knowledge = func(relative_to, relative_target)
@@ -214,6 +305,7 @@ class RoughOperations(RoughApproximation):
             target_knowledge = func(relative_to)
         return indispensables, possible_reducts, target_knowledge
 
+    @memoize
     def find_reducts(
         self, relations: set, relative_to: set = None, mode: callable = None
     ) -> frozenset:
@@ -231,6 +323,11 @@ class RoughOperations(RoughApproximation):
         Returns:
             The set of reducts.
         """
+        # pylint: disable=comparison-with-callable
+        if (
+            mode is None or (relative_to is None and mode == self.indiscernibility)
+        ) and all(self._is_partition(relation) for relation in relations):
+            return self.__search_reducts(frozenset(relations), relative_to)
         if relative_to is None:
             if mode is None:
                 mode = self.indiscernibility
@@ -247,7 +344,7 @@ class RoughOperations(RoughApproximation):
                     if self.independent(frozenset(possible_reduct), mode=mode)
                     # and self.depends_on(relations, frozenset(possible_reduct))
                     and mode(possible_reduct) == target_knowledge
-                    and len(indispensables.intersection(possible_reduct)) > 0
+                    and not indispensables.isdisjoint(possible_reduct)
                 ]
             )
         # calculate the relative REDUCT
@@ -267,10 +364,275 @@ class RoughOperations(RoughApproximation):
                 # and self.depends_on(relative_to, frozenset(possible_reduct))
                 and self.find_relative_positive_region(possible_reduct, relative_to)
                 == target_knowledge
-                and len(indispensables.intersection(possible_reduct)) > 0
+                and not indispensables.isdisjoint(possible_reduct)
             ]
         )
 
+    def __search_reducts(
+        self, relations: frozenset, relative_to: Optional[set]
+    ) -> frozenset:
+        """
+        A helper method for find_reducts() that finds the same reducts without checking every
+        subset of "relations". The relations are equivalence relations, so the knowledge of a
+        subset never exceeds the knowledge of its supersets. Hence, every reduct contains the
+        indispensable relations (i.e., the core), and a subset of the relations is a reduct if and
+        only if it preserves the knowledge and contains no smaller reduct. The subsets are visited
+        from the smallest to the largest, where the partition of each subset is refined from the
+        partition of the subset without its last relation, and any superset of a reduct is skipped.
+
+        Args:
+            relations: The set of relations to find the reducts.
+            relative_to: The set of relations to find the relative positive region, or None.
+
+        Returns:
+            The set of reducts (each with at least two relations, see find_reducts).
+        """
+        target = self.__knowledge_of(
+            self._indiscernibility_masks(relations), relative_to
+        )
+        core = frozenset(
+            relation
+            for relation in relations
+            if not self.dispensable(
+                relations, relation, relative_to, mode=self.indiscernibility
+            )
+        )
+        if not core:
+            return frozenset()  # a reduct must have at least one indispensable relation
+        others = list(relations - core)
+        core_blocks = [self._related_mask()]
+        for relation in core:
+            core_blocks = self._split_blocks(core_blocks, relation)
+
+        reducts = []  # bitmasks over "others", where the i'th bit is the i'th relation
+        # each subset is a bitmask over "others", the index of its last relation, and its blocks
+        subsets = [(0, -1, core_blocks)]
+        while subsets:
+            larger_subsets = []
+            for subset, last, blocks in subsets:
+                if any(reduct & subset == reduct for reduct in reducts):
+                    continue  # a superset of a reduct is not independent
+                if self.__knowledge_of(blocks, relative_to) == target:
+                    reducts.append(subset)
+                    continue
+                for index in range(last + 1, len(others)):
+                    larger_subsets.append(
+                        (
+                            subset | 1 << index,
+                            index,
+                            self._split_blocks(blocks, others[index]),
+                        )
+                    )
+            subsets = larger_subsets
+        return frozenset(
+            core.union(
+                relation for index, relation in enumerate(others) if reduct >> index & 1
+            )
+            for reduct in reducts
+            if len(core) + bin(reduct).count("1") > 1
+        )
+
+    def __knowledge_of(self, blocks: List[int], relative_to: Optional[set]) -> int:
+        """
+        A helper method for __search_reducts() that measures the knowledge of a partition (e.g., U
+        / P). If "relative_to" is None, this is the number of blocks of the partition; otherwise,
+        it is the positive region of "relative_to" (as a bitmask). Either is only comparable
+        between partitions where one is a refinement of the other.
+
+        Args:
+            blocks: The blocks of the partition, as bitmasks.
+            relative_to: The set of relations to find the relative positive region, or None.
+
+        Returns:
+            The knowledge of the partition.
+        """
+        if relative_to is None:
+            return len(blocks)
+        return self._positive_region_of(blocks, relative_to)
+
+    def find_reduct(self, relations: set, relative_to: set = None) -> frozenset:
+        """
+        Find a single reduct of the knowledge base given the "relations", relative to the relations
+        specified in "relative_to", if applicable. Unlike find_reducts, which checks every subset
+        of "relations", the relations are greedily removed while the knowledge is preserved,
+        trying the relations whose removal loses the least knowledge first. How much knowledge a
+        relation loses only grows as other relations are removed, so the loss last calculated for
+        a relation is only recalculated once it is the next relation to try (i.e., lazy greedy).
+
+        If a relation is not a partition (see _is_partition), the knowledge itself is compared,
+        and a relation that was kept may become dispensable as others are removed.
+
+        Args:
+            relations: The set of relations (or a single relation) to find a reduct of.
+            relative_to: The set of relations to find the relative positive region. If None, then
+            the reduct preserves the indiscernibility relation of "relations".
+
+        Returns:
+            A reduct (i.e., an independent subset of "relations" that preserves the knowledge).
+        """
+        if relative_to is None:
+            knowledge = self.indiscernibility
+        else:
+
+            def knowledge(subset):
+                return self.find_relative_positive_region(subset, relative_to)
+
+        if isinstance(relations, str):
+            relations = (relations,)
+        reduct = frozenset(relations)
+        target = knowledge(reduct)
+        # for partitions, the knowledge of a subset is never finer (or larger) than the knowledge
+        # of the relations, so it is preserved if and only if its size is (i.e., a loss of 0)
+        partitions = all(self._is_partition(relation) for relation in reduct)
+
+        def loss_without(relation) -> int:
+            subset_knowledge = knowledge(reduct - {relation})
+            loss = len(target) - len(subset_knowledge)
+            if partitions or subset_knowledge == target:
+                return loss
+            return max(abs(loss), 1)  # the knowledge is not preserved
+
+        # the number of relations removed so far, to detect outdated losses
+        removals = 0
+        queue = []
+        if len(reduct) > 1:
+            queue = [
+                (loss_without(relation), order, 0, relation)
+                for order, relation in enumerate(reduct)
+            ]
+            heapify(queue)
+        while queue and len(reduct) > 1:
+            loss, order, calculated_at, relation = heappop(queue)
+            if calculated_at != removals:
+                loss = loss_without(relation)
+                if queue and loss > queue[0][0]:
+                    # another relation may lose less knowledge, try that one first
+                    heappush(queue, (loss, order, removals, relation))
+                    continue
+            if loss == 0:
+                reduct -= {relation}
+                removals += 1
+            # otherwise, the relation is indispensable (and if the relations are partitions, it
+            # remains so as relations are removed)
+        return reduct
+
+    def find_reducts_via_discernibility(
+        self, relations: set, relative_to: set = None
+    ) -> frozenset:
+        """
+        Find the reducts of the knowledge base given the "relations", relative to the relations
+        specified in "relative_to", if applicable, with the discernibility matrix rather than by
+        checking every subset of "relations". Each entry of the matrix is the set of relations that
+        discern a pair of equivalence classes of IND(relations), and the reducts are the minimal
+        subsets of "relations" that intersect every entry (see "The Discernibility Matrices and
+        Functions in Information Systems" by Skowron and Rauszer).
+
+        Unlike find_reducts, which only keeps reducts with at least two relations and at least one
+        indispensable relation (so none if the core is empty), every reduct is found here.
+
+        Args:
+            relations: The set of relations (or a single relation) to find the reducts.
+            relative_to: The set of relations to find the relative positive region. If None, then
+            the reducts preserve the indiscernibility relation of "relations".
+
+        Returns:
+            The set of reducts.
+        """
+        if isinstance(relations, str):
+            relations = (relations,)
+        relations = list(frozenset(relations))
+        clauses = self.__discernibility_clauses(relations, relative_to)
+        if not clauses:
+            # nothing needs to be discerned, and the relations may not be empty (see
+            # indiscernibility), so each relation on its own is a reduct
+            return frozenset(frozenset({relation}) for relation in relations)
+        return frozenset(
+            frozenset(
+                relation
+                for bit, relation in enumerate(relations)
+                if transversal >> bit & 1
+            )
+            for transversal in minimal_transversals(clauses)
+        )
+
+    def __discernibility_clauses(self, relations: list, relative_to: set) -> Set[int]:
+        """
+        A helper method for find_reducts_via_discernibility() that calculates the distinct entries
+        of the discernibility matrix, where the i'th relation is the i'th bit of an entry. If
+        "relative_to" is given, a pair of equivalence classes only needs to be discerned if at
+        least one of them is in the positive region and they are not within the same category of
+        U / relative_to.
+
+        Args:
+            relations: The list of relations.
+            relative_to: The set of relations to find the relative positive region, or None.
+
+        Returns:
+            The distinct entries of the discernibility matrix, as bitmasks over the relations.
+        """
+        blocks = sorted(self._indiscernibility_masks(relations))
+        if not all(self._is_partition(relation) for relation in relations):
+            raise ValueError("The relations must be equivalence relations.")
+        relation_labels = [self._relation_labels(relation) for relation in relations]
+        # the category of each block of U / P if it is in the positive region, otherwise None
+        categories = [None] * len(blocks)
+        if relative_to is not None:
+            category_of = self._element_blocks(
+                self._indiscernibility_masks(relative_to)
+            )
+            for index, block in enumerate(blocks):
+                category = category_of[(block & -block).bit_length() - 1]
+                if category and not block & ~category:
+                    categories[index] = category
+
+        clauses = set()
+        for index, block in enumerate(blocks):
+            position = (block & -block).bit_length() - 1
+            for other_index in range(index + 1, len(blocks)):
+                other_block = blocks[other_index]
+                if relative_to is not None and not self.__must_discern(
+                    (block, categories[index]), (other_block, categories[other_index])
+                ):
+                    continue
+                other_position = (other_block & -other_block).bit_length() - 1
+                clauses.add(
+                    sum(
+                        1 << bit
+                        for bit, labels in enumerate(relation_labels)
+                        if labels[position] != labels[other_position]
+                    )
+                )
+        return clauses
+
+    @staticmethod
+    def __must_discern(
+        block_and_category: Tuple[int, Optional[int]],
+        other_block_and_category: Tuple[int, Optional[int]],
+    ) -> bool:
+        """
+        A helper method for __discernibility_clauses() that determines whether a pair of
+        equivalence classes must be discerned to preserve the relative positive region.
+
+        Args:
+            block_and_category: An equivalence class and its category if it is in the positive
+            region, otherwise None (bitmasks).
+            other_block_and_category: Another equivalence class and its category if it is in the
+            positive region, otherwise None (bitmasks).
+
+        Returns:
+            True if the pair of equivalence classes must be discerned, False otherwise.
+        """
+        block, category = block_and_category
+        other_block, other_category = other_block_and_category
+        if category is None and other_category is None:
+            return False  # neither is in the positive region
+        if category is None:
+            return bool(block & ~other_category)
+        if other_category is None:
+            return bool(other_block & ~category)
+        return category != other_category
+
+    @memoize
     def find_core(
         self, relations: set, relative_to: set = None, mode: callable = None
     ) -> frozenset:
@@ -298,6 +660,56 @@ class RoughOperations(RoughApproximation):
                 results.add(relation)
         return frozenset(results)
 
+    def find_core_parallel(
+        self,
+        relations: set,
+        relative_to: set = None,
+        workers: Optional[int] = None,
+        min_relations: int = 8,
+    ) -> frozenset:
+        """
+        Find the core (or the relative core, if "relative_to" is given) as the set of all
+        indispensable relations, where the relations are checked in parallel by a pool of
+        processes. Each check is independent and CPU-bound, but starting the processes and
+        sending them the knowledge base has a cost, so the relations are only checked in
+        parallel if there are at least "min_relations" of them.
+
+        Args:
+            relations: The set of relations to find the core of.
+            relative_to: The set of relations to find the relative positive region. If None, then
+            the core preserves the indiscernibility relation of "relations".
+            workers: The maximum number of processes. If None, then the number of processors.
+            min_relations: The minimum number of relations to check them in parallel.
+
+        Returns:
+            The core.
+        """
+        relations = frozenset(relations)
+        if len(relations) < min_relations:
+            indispensables = [
+                not self.dispensable(
+                    relations, {relation}, relative_to, mode=self.indiscernibility
+                )
+                for relation in relations
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_initialize_worker, initargs=(self,)
+            ) as executor:
+                indispensables = list(
+                    executor.map(
+                        _indispensable,
+                        repeat(relations),
+                        repeat(relative_to),
+                        relations,
+                    )
+                )
+        return frozenset(
+            relation
+            for relation, indispensable in zip(relations, indispensables)
+            if indispensable
+        )
+
     def find_relative_positive_region(
         self, relations: Union[str, set], relative_to: Union[str, set]
     ) -> frozenset:
@@ -313,12 +725,120 @@ class RoughOperations(RoughApproximation):
         Returns:
             The relative positive region.
         """
-        # categories = self / relative_to
-        categories = self.indiscernibility(relative_to)
-        results = set()
-        for category in categories:
-            results = results.union(self.lower_approximation(relations, category))
-        return frozenset(results)
+        return self._items_of(self._positive_region_mask(relations, relative_to))
+
+    @memoize
+    def _positive_region_mask(
+        self, relations: Union[str, set], relative_to: Union[str, set]
+    ) -> int:
+        """
+        The P-positive region (POS) of Q (see find_relative_positive_region), encoded as a bitmask
+        (see _mask_of).
+
+        Args:
+            relations: The set of relations to find the relative positive region.
+            relative_to: The set of relations whose categories are to be classified.
+
+        Returns:
+            The bitmask of the relative positive region.
+        """
+        relations, relative_to = (
+            (argument,) if isinstance(argument, str) else argument
+            for argument in (relations, relative_to)
+        )
+        if (
+            self._strategy(relations) != "intersect"
+            and self._strategy(relative_to) != "intersect"
+        ):
+            # both are partitions, so each element has a single label in each (see
+            # _indiscernibility_index); a block of U / P is in the positive region if and only if
+            # its elements share a single label of a category of U / Q
+            labels, blocks, _ = self._indiscernibility_index(list(relations))
+            other_labels, categories, _ = self._indiscernibility_index(
+                list(relative_to)
+            )
+            pairs = set(zip(labels, other_labels))
+            pairs_of_label = Counter(label for label, _ in pairs)
+            positive = bytearray(len(blocks))
+            for label, other_label in pairs:
+                if (
+                    pairs_of_label[label] == 1
+                    and blocks[label]
+                    and categories[other_label]
+                ):
+                    positive[label] = 1
+            return pack_bits(bytes(map(positive.__getitem__, labels)))
+        return self._positive_region_of(
+            self._indiscernibility_masks(relations), relative_to
+        )
+
+    def _positive_region_of(
+        self, blocks: Iterable[int], relative_to: Union[str, set]
+    ) -> int:
+        """
+        The positive region of Q (see find_relative_positive_region) with respect to the given
+        blocks of a partition (e.g., U / P), encoded as a bitmask (see _mask_of).
+
+        Args:
+            blocks: The blocks of the partition, as bitmasks.
+            relative_to: The set of relations whose categories are to be classified.
+
+        Returns:
+            The bitmask of the relative positive region.
+        """
+        # the categories of U / Q and the blocks of U / P are bitmasks (see _mask_of), so the
+        # positive region is found with integer operations rather than by set operations
+        category_masks = self._indiscernibility_masks(relative_to)
+        if 0 in category_masks:
+            raise ValueError("The argument 'categories' may not have a length of zero.")
+        if not category_masks:
+            return 0
+        # each element's category (None if it has no category, or zero if it has several)
+        category_of = self._element_blocks(category_masks)
+        disjoint = 0 not in category_of
+        positive_region = 0
+        for block in blocks:
+            if not block:
+                continue
+            if disjoint:
+                # the only category that can contain the block is the one of its first element
+                category = category_of[(block & -block).bit_length() - 1]
+                if category is not None and not block & ~category:
+                    positive_region |= block
+            elif any(not block & ~category for category in category_masks):
+                positive_region |= block
+        return positive_region
+
+    def _preserves_positive_region(
+        self, relations: set, subset: set, relative_to: Union[str, set]
+    ) -> bool:
+        """
+        Determine whether the subset of relations has the same positive region of "relative_to" as
+        the relations. If the relations partition the universe and the categories of
+        "relative_to" are disjoint, then POS_{subset}(Q) is contained in POS_{relations}(Q), so
+        the blocks of U / subset are checked until one of them loses an element of the positive
+        region, rather than calculating POS_{subset}(Q) in its entirety.
+
+        Args:
+            relations: A set of relations.
+            subset: A subset of the relations.
+            relative_to: The set of relations whose categories are to be classified.
+
+        Returns:
+            True if the positive region is preserved, False otherwise.
+        """
+        target = self._positive_region_mask(relations, relative_to)
+        category_of = self._element_blocks(self._indiscernibility_masks(relative_to))
+        if 0 in category_of or not all(
+            self._is_partition(relation) for relation in relations
+        ):
+            return target == self._positive_region_mask(subset, relative_to)
+        for block in self._indiscernibility_masks(subset):
+            if block & target:
+                category = category_of[(block & -block).bit_length() - 1]
+                if category is None or block & ~category:
+                    return False  # an element of the positive region is no longer classified
+        return True
 
     def is_q_reduct_of_p(self, relations: set, restrictions: set, set_s: set) -> bool:
         """
@@ -359,6 +879,24 @@ class RoughOperations(RoughApproximation):
         Returns:
 
         """
+        if isinstance(relations, str):
+            relations = (relations,)
+        if isinstance(other_relations, str):
+            other_relations = (other_relations,)
+        if (
+            self._strategy(relations) != "intersect"
+            and self._strategy(other_relations) != "intersect"
+        ):
+            # each element's equivalence class of IND(P) must determine its class of IND(Q),
+            # i.e., no two elements with the same label of IND(P) have different labels of IND(Q)
+            other_label_of = {}
+            for label, other_label in zip(
+                self._indiscernibility_labels(list(relations)),
+                self._indiscernibility_labels(list(other_relations)),
+            ):
+                if other_label_of.setdefault(label, other_label) != other_label:
+                    return False
+            return True
         return all(
             # the elements of IND(P) must have at least 1 subset match in IND(Q)
             any(
@@ -8,16 +8,34 @@ import unittest
 from rough.decisions import RoughDecisions
 from tests.test_knowledge_representation_system import make_example
 
+# the expected result of simplifying the decision table in TestSimplificationOfDecisionTable
+_CORE_EXPECTED = {
+    1: {"b"},
+    2: {"a"},
+    3: {"a"},
+    4: {"b", "d"},
+    5: {"d"},
+}
+_REDUCT_EXPECTED = {
+    1: {frozenset(("b", "d")), frozenset(("b", "a"))},
+    2: {frozenset(("d", "a")), frozenset(("b", "a"))},
+    3: {frozenset(("a",))},
+    4: {frozenset(("b", "d"))},
+    5: {frozenset(("d",))},
+    6: {frozenset(("a",)), frozenset(("d",))},
+    7: {frozenset(("a",)), frozenset(("d",)), frozenset(("b",))},
+}
+
 
 class TestDecisionTable(unittest.TestCase):
     """
     Test rule consistency or decision table decomposition.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe, self.knowledge_base = make_example(class_to_test=RoughDecisions)
-        self.set_c, self.set_d = {"a", "b", "c"}, {"d", "e"}
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe, cls.knowledge_base = make_example(class_to_test=RoughDecisions)
+        cls.set_c, cls.set_d = {"a", "b", "c"}, {"d", "e"}
 
     def test_rule_consistency(self) -> None:
         """
@@ -61,17 +79,19 @@ class TestSimplificationOfDecisionTable(unittest.TestCase):
     and check that condition classes are correctly calculated.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = list(range(1, 8))
-        self.knowledge_base = RoughDecisions()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.knowledge_base.add_parent_relation("a", ({3}, {1, 2, 4, 5}, {6, 7}))
-        self.knowledge_base.add_parent_relation("b", ({1, 2, 3}, {4, 5, 6}, {7}))
-        self.knowledge_base.add_parent_relation("c", ({1, 2, 3, 4, 5, 6}, {7}))
-        self.knowledge_base.add_parent_relation("d", ({2, 3}, {1, 4}, {5, 6, 7}))
-        self.knowledge_base.add_parent_relation("e", ({3, 4}, {1, 2}, {5, 6, 7}))
-        self.set_c, self.set_d = {"a", "b", "c", "d"}, {"e"}
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = list(range(1, 8))
+        cls.knowledge_base = RoughDecisions()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.knowledge_base.add_parent_relation("a", ({3}, {1, 2, 4, 5}, {6, 7}))
+        cls.knowledge_base.add_parent_relation("b", ({1, 2, 3}, {4, 5, 6}, {7}))
+        cls.knowledge_base.add_parent_relation("c", ({1, 2, 3, 4, 5, 6}, {7}))
+        cls.knowledge_base.add_parent_relation("d", ({2, 3}, {1, 4}, {5, 6, 7}))
+        cls.knowledge_base.add_parent_relation("e", ({3, 4}, {1, 2}, {5, 6, 7}))
+        cls.set_c, cls.set_d = {"a", "b", "c", "d"}, {"e"}
+        # the relative reduct search is the most expensive call here; share its result
+        cls.reducts = cls.knowledge_base.find_reducts(cls.set_c, relative_to=cls.set_d)
 
     def test_c_is_dispensable(self) -> None:
         """
@@ -85,9 +105,7 @@ class TestSimplificationOfDecisionTable(unittest.TestCase):
         )
 
         # pick the first relative reduct
-        (subset_of_set_c,) = self.knowledge_base.find_reducts(
-            self.set_c, relative_to=self.set_d
-        )
+        (subset_of_set_c,) = self.reducts
         assert subset_of_set_c == frozenset({"b", "a", "d"})
         assert self.knowledge_base.remove_redundant_attributes(
             self.set_c, self.set_d
@@ -103,9 +121,7 @@ class TestSimplificationOfDecisionTable(unittest.TestCase):
         partition_in_each_attribute = self.knowledge_base[1]
 
         # pick the first relative reduct
-        (subset_of_set_c,) = self.knowledge_base.find_reducts(
-            self.set_c, relative_to=self.set_d
-        )
+        (subset_of_set_c,) = self.reducts
         family_of_sets = {
             key: value
             for key, value in partition_in_each_attribute.items()
@@ -124,19 +140,5 @@ class TestSimplificationOfDecisionTable(unittest.TestCase):
             core_attributes,
             reduct_attributes,
         ) = self.knowledge_base.simplify_decision_table(self.set_c, self.set_d)
-        assert core_attributes == {
-            1: {"b"},
-            2: {"a"},
-            3: {"a"},
-            4: {"b", "d"},
-            5: {"d"},
-        }
-        assert reduct_attributes == {
-            1: {frozenset({"b", "d"}), frozenset({"b", "a"})},
-            2: {frozenset({"d", "a"}), frozenset({"b", "a"})},
-            3: {frozenset({"a"})},
-            4: {frozenset({"b", "d"})},
-            5: {frozenset({"d"})},
-            6: {frozenset({"a"}), frozenset({"d"})},
-            7: {frozenset({"a"}), frozenset({"d"}), frozenset({"b"})},
-        }
+        assert core_attributes == _CORE_EXPECTED
+        assert reduct_attributes == _REDUCT_EXPECTED
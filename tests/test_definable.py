@@ -4,28 +4,64 @@ given a family of relations.
 """
 
 import unittest
+from typing import Tuple
 
 from rough.approximation import RoughApproximation
 
 
+def approximate(
+    knowledge_base: RoughApproximation, relations: str, category: frozenset
+) -> Tuple[frozenset, frozenset, frozenset, float]:
+    """
+    Calculate the lower approximation, upper approximation, boundary region and accuracy of a
+    category with a single lower and upper approximation call each; the boundary region and the
+    accuracy are derived from them (see page 10 of the book). The library's own boundary_region
+    and accuracy are covered by the tests in test_sets.py.
+
+    Args:
+        knowledge_base: The RoughApproximation that holds the relations.
+        relations: The relation(s) to approximate the category with.
+        category: The category to approximate.
+
+    Returns:
+        The lower approximation, upper approximation, boundary region and accuracy.
+    """
+    lower = knowledge_base.lower_approximation(relations, category)
+    upper = knowledge_base.upper_approximation(relations, category)
+    return lower, upper, upper - lower, len(lower) / len(upper)
+
+
 class TestDefinable(unittest.TestCase):
     """
     Test the various forms of definability return the expected results.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(0, 11)]
-        self.knowledge_base = RoughApproximation()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.set_e_1 = {"x0", "x1"}
-        self.set_e_2 = {"x2", "x6", "x9"}
-        self.set_e_3 = {"x3", "x5"}
-        self.set_e_4 = {"x4", "x8"}
-        self.set_e_5 = {"x7", "x10"}
-        self.knowledge_base.add_parent_relation(
-            "R", (self.set_e_1, self.set_e_2, self.set_e_3, self.set_e_4, self.set_e_5)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = [f"x{i}" for i in range(0, 11)]
+        cls.knowledge_base = RoughApproximation()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.set_e_1 = frozenset({"x0", "x1"})
+        cls.set_e_2 = frozenset({"x2", "x6", "x9"})
+        cls.set_e_3 = frozenset({"x3", "x5"})
+        cls.set_e_4 = frozenset({"x4", "x8"})
+        cls.set_e_5 = frozenset({"x7", "x10"})
+        cls.knowledge_base.add_parent_relation(
+            "R", (cls.set_e_1, cls.set_e_2, cls.set_e_3, cls.set_e_4, cls.set_e_5)
         )
+        # unions of the R-basic categories that the assertions below expect
+        cls.set_e_14 = cls.set_e_1 | cls.set_e_4
+        cls.set_e_15 = cls.set_e_1 | cls.set_e_5
+        cls.set_e_23 = cls.set_e_2 | cls.set_e_3
+        cls.set_e_34 = cls.set_e_3 | cls.set_e_4
+        cls.set_e_123 = cls.set_e_1 | cls.set_e_23
+        cls.set_e_145 = cls.set_e_14 | cls.set_e_5
+        cls.set_e_234 = cls.set_e_23 | cls.set_e_4
+        cls.set_e_1235 = cls.set_e_123 | cls.set_e_5
+        cls.set_e_1245 = cls.set_e_145 | cls.set_e_2
+        cls.set_e_1345 = cls.set_e_15 | cls.set_e_34
+        cls.set_e_2345 = cls.set_e_234 | cls.set_e_5
+        cls.universe_set = frozenset(cls.universe)
 
     def test_definable(self) -> None:
         """
@@ -68,46 +104,26 @@ class TestDefinable(unittest.TestCase):
             == "RoughlyDefinable"
         )
 
-        # the approximations
-
-        assert self.knowledge_base.lower_approximation("R", set_x_2) == frozenset(
-            self.set_e_3
-        ).union(self.set_e_4)
-        assert self.knowledge_base.upper_approximation("R", set_x_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_3).union(self.set_e_4).union(self.set_e_5)
+        # the lower and upper approximations, the boundaries and the accuracies
 
-        assert self.knowledge_base.lower_approximation("R", set_y_2) == frozenset(
-            self.set_e_5
+        assert approximate(self.knowledge_base, "R", set_x_2) == (
+            self.set_e_34,
+            self.set_e_1345,
+            self.set_e_15,
+            1 / 2,
         )
-        assert self.knowledge_base.upper_approximation("R", set_y_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_4).union(self.set_e_5)
-
-        assert self.knowledge_base.lower_approximation("R", set_z_2) == frozenset(
-            self.set_e_4
+        assert approximate(self.knowledge_base, "R", set_y_2) == (
+            self.set_e_5,
+            self.set_e_145,
+            self.set_e_14,
+            1 / 3,
+        )
+        assert approximate(self.knowledge_base, "R", set_z_2) == (
+            self.set_e_4,
+            self.set_e_234,
+            self.set_e_23,
+            2 / 7,
         )
-        assert self.knowledge_base.upper_approximation("R", set_z_2) == frozenset(
-            self.set_e_2
-        ).union(self.set_e_3).union(self.set_e_4)
-
-        # the boundaries
-
-        assert self.knowledge_base.boundary_region("R", set_x_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_5)
-        assert self.knowledge_base.boundary_region("R", set_y_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_4)
-        assert self.knowledge_base.boundary_region("R", set_z_2) == frozenset(
-            self.set_e_2
-        ).union(self.set_e_3)
-
-        # the accuracies
-
-        assert self.knowledge_base.accuracy("R", set_x_2) == 1 / 2
-        assert self.knowledge_base.accuracy("R", set_y_2) == 1 / 3
-        assert self.knowledge_base.accuracy("R", set_z_2) == 2 / 7
 
     def test_externally_undefinable(self) -> None:
         """
@@ -134,46 +150,26 @@ class TestDefinable(unittest.TestCase):
             == "ExternallyUndefinable"
         )
 
-        # the approximations
-
-        assert self.knowledge_base.lower_approximation("R", set_x_3) == frozenset(
-            self.set_e_1
-        )
-        assert self.knowledge_base.upper_approximation("R", set_x_3) == frozenset(
-            self.universe
-        )
+        # the lower and upper approximations, the boundaries and the accuracies
 
-        assert self.knowledge_base.lower_approximation("R", set_y_3) == frozenset(
-            self.set_e_2
+        assert approximate(self.knowledge_base, "R", set_x_3) == (
+            self.set_e_1,
+            self.universe_set,
+            self.set_e_2345,
+            2 / 11,
         )
-        assert self.knowledge_base.upper_approximation("R", set_y_3) == frozenset(
-            self.universe
+        assert approximate(self.knowledge_base, "R", set_y_3) == (
+            self.set_e_2,
+            self.universe_set,
+            self.set_e_1345,
+            3 / 11,
         )
-
-        assert self.knowledge_base.lower_approximation("R", set_z_3) == frozenset(
-            self.set_e_4
+        assert approximate(self.knowledge_base, "R", set_z_3) == (
+            self.set_e_4,
+            self.universe_set,
+            self.set_e_1235,
+            2 / 11,
         )
-        assert self.knowledge_base.upper_approximation("R", set_z_3) == frozenset(
-            self.universe
-        )
-
-        # the boundaries
-
-        assert self.knowledge_base.boundary_region("R", set_x_3) == frozenset(
-            self.set_e_2
-        ).union(self.set_e_3).union(self.set_e_4).union(self.set_e_5)
-        assert self.knowledge_base.boundary_region("R", set_y_3) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_3).union(self.set_e_4).union(self.set_e_5)
-        assert self.knowledge_base.boundary_region("R", set_z_3) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_3).union(self.set_e_5)
-
-        # the accuracies
-
-        assert self.knowledge_base.accuracy("R", set_x_3) == 2 / 11
-        assert self.knowledge_base.accuracy("R", set_y_3) == 3 / 11
-        assert self.knowledge_base.accuracy("R", set_z_3) == 2 / 11
 
     def test_internally_undefinable(self) -> None:
         """
@@ -202,15 +198,9 @@ class TestDefinable(unittest.TestCase):
 
         # the approximations
 
-        assert self.knowledge_base.upper_approximation("R", set_x_4) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_3)
-        assert self.knowledge_base.upper_approximation("R", set_y_4) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_4).union(self.set_e_5)
-        assert self.knowledge_base.upper_approximation("R", set_z_4) == frozenset(
-            self.set_e_2
-        ).union(self.set_e_3).union(self.set_e_4)
+        assert self.knowledge_base.upper_approximation("R", set_x_4) == self.set_e_123
+        assert self.knowledge_base.upper_approximation("R", set_y_4) == self.set_e_1245
+        assert self.knowledge_base.upper_approximation("R", set_z_4) == self.set_e_234
 
     def test_totally_undefinable(self) -> None:
         """
@@ -237,72 +227,31 @@ class TestDefinable(unittest.TestCase):
             == "TotallyUndefinable"
         )
 
-    def test_invalid_argument_for_lower_approximation(self) -> None:
+    def test_invalid_empty_category(self) -> None:
         """
-        Test the argument 'categories' may not have a length of zero.
+        Test the argument 'categories' (or 'category') may not have a length of zero.
 
         Returns:
             None
         """
-        self.assertRaises(
-            ValueError,
-            self.knowledge_base.lower_approximation,
-            relations="R",
-            categories=frozenset({}),
-        )
-
-    def test_invalid_argument_for_upper_approximation(self) -> None:
-        """
-        Test the argument 'categories' may not have a length of zero.
-
-        Returns:
-            None
-        """
-        self.assertRaises(
-            ValueError,
-            self.knowledge_base.upper_approximation,
-            relations="R",
-            categories=frozenset({}),
-        )
-
-    def test_invalid_argument_for_boundary_region(self) -> None:
-        """
-        Test the argument 'categories' may not have a length of zero.
-
-        Returns:
-            None
-        """
-        self.assertRaises(
-            ValueError,
-            self.knowledge_base.boundary_region,
-            relations="R",
-            categories=frozenset({}),
-        )
-
-    def test_invalid_argument_for_accuracy(self) -> None:
-        """
-        Test the argument 'categories' may not have a length of zero.
-
-        Returns:
-            None
-        """
-        self.assertRaises(
-            ValueError,
-            self.knowledge_base.accuracy,
-            relations="R",
-            category=frozenset({}),
-        )
-
-    def test_invalid_argument_for_definable(self) -> None:
-        """
-        Test the argument 'categories' may not have a length of zero.
-
-        Returns:
-            None
-        """
-        self.assertRaises(
-            ValueError,
-            self.knowledge_base.definable,
-            relations="R",
-            category=frozenset({}),
-        )
+        for name, method, kwargs in (
+            (
+                "lower_approximation",
+                self.knowledge_base.lower_approximation,
+                {"categories": frozenset()},
+            ),
+            (
+                "upper_approximation",
+                self.knowledge_base.upper_approximation,
+                {"categories": frozenset()},
+            ),
+            (
+                "boundary_region",
+                self.knowledge_base.boundary_region,
+                {"categories": frozenset()},
+            ),
+            ("accuracy", self.knowledge_base.accuracy, {"category": frozenset()}),
+            ("definable", self.knowledge_base.definable, {"category": frozenset()}),
+        ):
+            with self.subTest(method=name):
+                self.assertRaises(ValueError, method, relations="R", **kwargs)
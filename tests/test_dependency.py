@@ -13,9 +13,23 @@ class TestDependenciesInRoughOperations(unittest.TestCase):
     Test the dependency relations.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = list(range(1, 9))
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = list(range(1, 9))
+        # Q totally depends on P
+        cls.total_dependency = RoughOperations()
+        cls.total_dependency.set_granules(cls.universe, tags="element")
+        cls.total_dependency.add_parent_relation(
+            "P", ({1, 5}, {2, 8}, {3}, {4}, {6}, {7})
+        )
+        cls.total_dependency.add_parent_relation("Q", ({1, 5}, {2, 7, 8}, {3, 4, 6}))
+        # Q partially depends on P
+        cls.set_x = ({1}, {2, 7}, {3, 6}, {4}, {5, 8})
+        cls.set_y = ({1, 5}, {2, 8}, {3}, {4}, {6}, {7})
+        cls.partial_dependency = RoughOperations()
+        cls.partial_dependency.set_granules(cls.universe, tags="element")
+        cls.partial_dependency.add_parent_relation("Q", cls.set_x)
+        cls.partial_dependency.add_parent_relation("P", cls.set_y)
 
     def test_depends_on(self) -> None:
         """
@@ -27,22 +41,19 @@ class TestDependenciesInRoughOperations(unittest.TestCase):
         Returns:
             None
         """
-        knowledge_base = RoughOperations()
-        knowledge_base.set_granules(self.universe, tags="element")
-        knowledge_base.add_parent_relation("P", ({1, 5}, {2, 8}, {3}, {4}, {6}, {7}))
-        knowledge_base.add_parent_relation("Q", ({1, 5}, {2, 7, 8}, {3, 4, 6}))
+        knowledge_base = self.total_dependency
 
         assert knowledge_base.depends_on("P", "Q")
         # partial dependency should equal 1 if depends_on is True
         assert knowledge_base.partial_depends_on("P", "Q") == 1.0
         # the following are all equivalent to the statement above
-        assert knowledge_base.indiscernibility(
-            {"P", "Q"}
-        ) == knowledge_base.indiscernibility({"P"})
-        assert knowledge_base.find_relative_positive_region({"P"}, {"Q"}) == frozenset(
-            self.universe
-        )
-        for set_x in knowledge_base / "Q":  # aka 'lower' of IND(P)set_x
+        p_partition = knowledge_base.indiscernibility({"P"})
+        p_q_partition = knowledge_base.indiscernibility({"P", "Q"})
+        assert p_q_partition == p_partition
+        positive_region = knowledge_base.find_relative_positive_region({"P"}, {"Q"})
+        assert positive_region == frozenset(self.universe)
+        q_categories = knowledge_base / "Q"
+        for set_x in q_categories:  # aka 'lower' of IND(P)set_x
             assert knowledge_base.lower_approximation({"P"}, set_x)
 
     def test_partial_depends_on(self) -> None:
@@ -52,23 +63,9 @@ class TestDependenciesInRoughOperations(unittest.TestCase):
         Returns:
             None
         """
-        knowledge_base = RoughOperations()
-        knowledge_base.set_granules(self.universe, tags="element")
-        set_x_1, set_x_2, set_x_3, set_x_4, set_x_5 = {1}, {2, 7}, {3, 6}, {4}, {5, 8}
-        set_y_1, set_y_2, set_y_3, set_y_4, set_y_5, set_y_6 = (
-            {1, 5},
-            {2, 8},
-            {3},
-            {4},
-            {6},
-            {7},
-        )
-        knowledge_base.add_parent_relation(
-            "Q", (set_x_1, set_x_2, set_x_3, set_x_4, set_x_5)
-        )
-        knowledge_base.add_parent_relation(
-            "P", (set_y_1, set_y_2, set_y_3, set_y_4, set_y_5, set_y_6)
-        )
+        knowledge_base = self.partial_dependency
+        set_x_1, set_x_2, set_x_3, set_x_4, set_x_5 = self.set_x
+        _, _, set_y_3, set_y_4, set_y_5, set_y_6 = self.set_y
 
         assert knowledge_base.lower_approximation("P", set_x_1) == frozenset()
         assert knowledge_base.lower_approximation("P", set_x_2) == set_y_6
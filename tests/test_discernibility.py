@@ -6,21 +6,69 @@ import unittest
 
 from rough.decisions import RoughDecisions
 
+# expected (minimum) discernibility matrices over relations {a, b, c, d}
+_EXPECTED_DM = {
+    frozenset({1, 2}): frozenset({"c", "b", "a", "d"}),
+    frozenset({1, 3}): frozenset({"c", "b", "a"}),
+    frozenset({1, 4}): frozenset({"c", "a", "d"}),
+    frozenset({1, 5}): frozenset({"c", "a", "d"}),
+    frozenset({2, 3}): frozenset({"c", "b", "d"}),
+    frozenset({2, 4}): frozenset({"b", "a", "d"}),
+    frozenset({2, 5}): frozenset({"b"}),
+    frozenset({3, 4}): frozenset({"c", "b", "a", "d"}),
+    frozenset({3, 5}): frozenset({"c", "b", "d"}),
+    frozenset({4, 5}): frozenset({"a", "d"}),
+}
+_EXPECTED_MIN_DM = {
+    frozenset({1, 2}): frozenset({"b"}),
+    frozenset({1, 3}): frozenset({"b"}),
+    frozenset({1, 4}): frozenset({"a", "d"}),
+    frozenset({1, 5}): frozenset({"a", "d"}),
+    frozenset({2, 3}): frozenset({"b"}),
+    frozenset({2, 4}): frozenset({"b"}),
+    frozenset({2, 5}): frozenset({"b"}),
+    frozenset({3, 4}): frozenset({"b"}),
+    frozenset({3, 5}): frozenset({"b"}),
+    frozenset({4, 5}): frozenset({"a", "d"}),
+}
+
+# expected (minimum) discernibility matrices over relations {a, b, c} w.r.t. decision "d"
+_EXPECTED_DM_D = {
+    frozenset({1, 2}): frozenset({"c", "b", "a"}),
+    frozenset({1, 4}): frozenset({"c", "a"}),
+    frozenset({1, 5}): frozenset({"c", "a"}),
+    frozenset({2, 3}): frozenset({"c", "b"}),
+    frozenset({2, 4}): frozenset({"b", "a"}),
+    frozenset({3, 4}): frozenset({"c", "b", "a"}),
+    frozenset({3, 5}): frozenset({"c", "b"}),
+    frozenset({4, 5}): frozenset({"a"}),
+}
+_EXPECTED_MIN_DM_D = {
+    frozenset({1, 2}): frozenset({"a"}),
+    frozenset({1, 4}): frozenset({"a"}),
+    frozenset({1, 5}): frozenset({"a"}),
+    frozenset({2, 3}): frozenset({"c", "b"}),
+    frozenset({2, 4}): frozenset({"a"}),
+    frozenset({3, 4}): frozenset({"a"}),
+    frozenset({3, 5}): frozenset({"c", "b"}),
+    frozenset({4, 5}): frozenset({"a"}),
+}
+
 
 class TestDiscernibility(unittest.TestCase):
     """
     Test that discernibility is calculated correctly.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = list(range(1, 6))
-        self.knowledge_base = RoughDecisions()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.knowledge_base.add_parent_relation("a", ({1}, {2, 3, 5}, {4}))
-        self.knowledge_base.add_parent_relation("b", ({3}, {1, 4, 5}, {2}))
-        self.knowledge_base.add_parent_relation("c", ({2, 4, 5}, {3}, {1}))
-        self.knowledge_base.add_parent_relation("d", ({1, 3}, {4}, {2, 5}))
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = list(range(1, 6))
+        cls.knowledge_base = RoughDecisions()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.knowledge_base.add_parent_relation("a", ({1}, {2, 3, 5}, {4}))
+        cls.knowledge_base.add_parent_relation("b", ({3}, {1, 4, 5}, {2}))
+        cls.knowledge_base.add_parent_relation("c", ({2, 4, 5}, {3}, {1}))
+        cls.knowledge_base.add_parent_relation("d", ({1, 3}, {4}, {2, 5}))
 
     def test_discernibility_matrix(self) -> None:
         """
@@ -31,31 +79,12 @@ class TestDiscernibility(unittest.TestCase):
         """
         relations = {"a", "b", "c", "d"}
 
-        assert self.knowledge_base.discernibility_matrix(relations) == {
-            frozenset({1, 2}): {"c", "b", "a", "d"},
-            frozenset({1, 3}): {"c", "b", "a"},
-            frozenset({1, 4}): {"c", "a", "d"},
-            frozenset({1, 5}): {"c", "a", "d"},
-            frozenset({2, 3}): {"c", "b", "d"},
-            frozenset({2, 4}): {"b", "a", "d"},
-            frozenset({2, 5}): {"b"},
-            frozenset({3, 4}): {"c", "b", "a", "d"},
-            frozenset({3, 5}): {"c", "b", "d"},
-            frozenset({4, 5}): {"a", "d"},
-        }
+        assert self.knowledge_base.discernibility_matrix(relations) == _EXPECTED_DM
 
-        assert self.knowledge_base.minimum_discernibility_matrix(relations) == {
-            frozenset({1, 2}): frozenset({"b"}),
-            frozenset({1, 3}): frozenset({"b"}),
-            frozenset({1, 4}): frozenset({"a", "d"}),
-            frozenset({1, 5}): frozenset({"a", "d"}),
-            frozenset({2, 3}): frozenset({"b"}),
-            frozenset({2, 4}): frozenset({"b"}),
-            frozenset({2, 5}): frozenset({"b"}),
-            frozenset({3, 4}): frozenset({"b"}),
-            frozenset({3, 5}): frozenset({"b"}),
-            frozenset({4, 5}): frozenset({"a", "d"}),
-        }
+        assert (
+            self.knowledge_base.minimum_discernibility_matrix(relations)
+            == _EXPECTED_MIN_DM
+        )
 
     def test_discernibility_matrix_on_decision_attribute(self) -> None:
         """
@@ -66,26 +95,13 @@ class TestDiscernibility(unittest.TestCase):
         """
         relations = {"a", "b", "c"}
 
-        assert self.knowledge_base.discernibility_matrix(relations, "d") == {
-            frozenset({1, 2}): {"c", "b", "a"},
-            frozenset({1, 4}): {"c", "a"},
-            frozenset({1, 5}): {"c", "a"},
-            frozenset({2, 3}): {"c", "b"},
-            frozenset({2, 4}): {"b", "a"},
-            frozenset({3, 4}): {"c", "b", "a"},
-            frozenset({3, 5}): {"c", "b"},
-            frozenset({4, 5}): {"a"},
-        }
+        assert (
+            self.knowledge_base.discernibility_matrix(relations, "d") == _EXPECTED_DM_D
+        )
 
-        assert self.knowledge_base.minimum_discernibility_matrix(
-            relations, decision_attributes="d"
-        ) == {
-            frozenset({1, 2}): {"a"},
-            frozenset({1, 4}): {"a"},
-            frozenset({1, 5}): {"a"},
-            frozenset({2, 3}): {"c", "b"},
-            frozenset({2, 4}): {"a"},
-            frozenset({3, 4}): {"a"},
-            frozenset({3, 5}): {"c", "b"},
-            frozenset({4, 5}): {"a"},
-        }
+        assert (
+            self.knowledge_base.minimum_discernibility_matrix(
+                relations, decision_attributes="d"
+            )
+            == _EXPECTED_MIN_DM_D
+        )
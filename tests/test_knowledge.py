@@ -3,24 +3,73 @@ Tests various aspects of the RoughOperations such as whether it is equivalent to
 RoughOperations, how it can be reduced, and relative operations such as the relative CORE.
 """
 
+import pickle
 import unittest
 
 from rough.operations import RoughOperations
 from tests.test_relations import example_knowledge_base
 
 
+def example_knowledge_base_blob() -> bytes:
+    """
+    Build the example knowledge base (see example_knowledge_base) once and pickle it, so that
+    copies of it can be made by unpickling rather than by adding its relations again.
+
+    Returns:
+        The pickled example knowledge base.
+    """
+    knowledge_base = RoughOperations()
+    example_knowledge_base(knowledge_base, [f"x{i}" for i in range(1, 10)])
+    return pickle.dumps(knowledge_base, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+EXAMPLE_KNOWLEDGE_BASE_BLOB = example_knowledge_base_blob()
+
+
+# expected results of Example 2 on page 36 (see TestRelativeReductAndRelativeCore)
+_X1_X5 = frozenset(("x1", "x5"))
+_X3_X4 = frozenset(("x3", "x4"))
+_X2_X8 = frozenset(("x2", "x8"))
+_X6 = frozenset(("x6",))
+_X7 = frozenset(("x7",))
+_IND_PQR = frozenset((_X1_X5, _X3_X4, _X2_X8, _X6, _X7))
+_IND_QR = frozenset((_X1_X5, _X3_X4, frozenset(("x2", "x7", "x8")), _X6))
+_IND_PR = frozenset((frozenset(("x1", "x5", "x6")), _X3_X4, _X2_X8, _X7))
+_IND_PQ = frozenset(
+    (frozenset(("x1", "x3", "x4", "x5")), _X2_X8, frozenset(("x6", "x7")))
+)
+_POS_PQR = frozenset(("x1", "x3", "x4", "x5", "x6", "x7"))
+_POS_QR = frozenset(("x1", "x3", "x4", "x5", "x6"))
+_S_REDUCT = frozenset(("P", "R"))
+
+
 class TestEquivalentKnowledge(unittest.TestCase):
     """
     Test that two RoughOperations objects are equivalent under the expected circumstances.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 10)]
-        self.knowledge_1 = RoughOperations()
-        self.knowledge_1.set_granules(self.universe, tags="element")
-        self.knowledge_2 = RoughOperations()
-        self.knowledge_2.set_granules(self.universe, tags="element")
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = [f"x{i}" for i in range(1, 10)]
+        # the same relations
+        cls.knowledge_1 = pickle.loads(EXAMPLE_KNOWLEDGE_BASE_BLOB)
+        cls.knowledge_2 = pickle.loads(EXAMPLE_KNOWLEDGE_BASE_BLOB)
+        # only the first knowledge base has the relation 'R3'
+        cls.knowledge_3 = RoughOperations()
+        cls.knowledge_4 = RoughOperations()
+        for idx, knowledge_base in enumerate([cls.knowledge_3, cls.knowledge_4]):
+            knowledge_base.set_granules(cls.universe, tags="element")
+            knowledge_base.add_parent_relation(
+                "R1", ({"x1", "x3", "x7"}, {"x2", "x4"}, {"x5", "x6", "x8"})
+            )
+            knowledge_base.add_parent_relation(
+                "R2", ({"x1", "x5"}, {"x2", "x6"}, {"x3", "x4", "x7", "x8"})
+            )
+
+            if idx == 0:
+                knowledge_base.add_parent_relation(
+                    "R3", ({"x2", "x7", "x8"}, {"x1", "x3", "x4", "x5", "x6"})
+                )
 
     def test_equivalent_knowledge(self) -> None:
         """
@@ -29,16 +78,13 @@ class TestEquivalentKnowledge(unittest.TestCase):
         Returns:
             None
         """
-        for knowledge_base in [self.knowledge_1, self.knowledge_2]:
-            example_knowledge_base(knowledge_base, self.universe)
-
         assert frozenset((self.knowledge_1 / ["R1", "R2", "R3"]).values()) == frozenset(
             (self.knowledge_2 / ["R1", "R2", "R3"]).values()
         )
 
-        assert self.knowledge_1.indiscernibility(
+        assert self.knowledge_1.indiscernibility_canonical(
             ["R1", "R2", "R3"]
-        ) == self.knowledge_2.indiscernibility(["R1", "R2", "R3"])
+        ) == self.knowledge_2.indiscernibility_canonical(["R1", "R2", "R3"])
 
     def test_nonequivalent_knowledge(self) -> None:
         """
@@ -48,37 +94,24 @@ class TestEquivalentKnowledge(unittest.TestCase):
         Returns:
             None
         """
-        for idx, knowledge_base in enumerate([self.knowledge_1, self.knowledge_2]):
-            knowledge_base.add_parent_relation(
-                "R1", ({"x1", "x3", "x7"}, {"x2", "x4"}, {"x5", "x6", "x8"})
-            )
-            knowledge_base.add_parent_relation(
-                "R2", ({"x1", "x5"}, {"x2", "x6"}, {"x3", "x4", "x7", "x8"})
-            )
-
-            if idx == 0:
-                knowledge_base.add_parent_relation(
-                    "R3", ({"x2", "x7", "x8"}, {"x1", "x3", "x4", "x5", "x6"})
-                )
-
-        assert frozenset((self.knowledge_1 / ["R1", "R2", "R3"]).values()) != frozenset(
-            (self.knowledge_2 / ["R1", "R2", "R3"]).values()
+        assert frozenset((self.knowledge_3 / ["R1", "R2", "R3"]).values()) != frozenset(
+            (self.knowledge_4 / ["R1", "R2", "R3"]).values()
         )
 
         with self.assertRaises(
             ValueError
         ):  # exception is thrown since relations are not subset
-            _ = self.knowledge_1.indiscernibility(
+            _ = self.knowledge_3.indiscernibility_canonical(
                 ["R1", "R2", "R3"]
-            ) != self.knowledge_2.indiscernibility(["R1", "R2", "R3"])
+            ) != self.knowledge_4.indiscernibility_canonical(["R1", "R2", "R3"])
 
-        assert frozenset((self.knowledge_1 / ["R1", "R2", "R3"]).values()) != frozenset(
-            (self.knowledge_2 / ["R1", "R2"]).values()
+        assert frozenset((self.knowledge_3 / ["R1", "R2", "R3"]).values()) != frozenset(
+            (self.knowledge_4 / ["R1", "R2"]).values()
         )
 
-        assert self.knowledge_1.indiscernibility(
+        assert self.knowledge_3.indiscernibility_canonical(
             ["R1", "R2", "R3"]
-        ) != self.knowledge_2.indiscernibility(["R1", "R2"])
+        ) != self.knowledge_4.indiscernibility_canonical(["R1", "R2"])
 
 
 class TestReductionOfKnowledge(unittest.TestCase):
@@ -87,12 +120,12 @@ class TestReductionOfKnowledge(unittest.TestCase):
     correctly calculated within the RoughOperations.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 10)]
-        self.knowledge_base = RoughOperations()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.knowledge_base.add_parent_relation(
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = [f"x{i}" for i in range(1, 10)]
+        cls.knowledge_base = RoughOperations()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.knowledge_base.add_parent_relation(
             "P",
             {
                 frozenset({"x1", "x4", "x5"}),
@@ -101,7 +134,7 @@ class TestReductionOfKnowledge(unittest.TestCase):
                 frozenset({"x6", "x7"}),
             },
         )
-        self.knowledge_base.add_parent_relation(
+        cls.knowledge_base.add_parent_relation(
             "Q",
             {
                 frozenset({"x1", "x3", "x5"}),
@@ -109,7 +142,7 @@ class TestReductionOfKnowledge(unittest.TestCase):
                 frozenset({"x2", "x4", "x7", "x8"}),
             },
         )
-        self.knowledge_base.add_parent_relation(
+        cls.knowledge_base.add_parent_relation(
             "R",
             {
                 frozenset({"x1", "x5"}),
@@ -195,6 +228,71 @@ class TestReductionOfKnowledge(unittest.TestCase):
             {frozenset({"P", "Q"}), frozenset({"P", "R"})}
         )
 
+    def test_reduct(self) -> None:
+        """
+        Test that a single reduct is found without calculating all the reducts.
+
+        Returns:
+            None
+        """
+        reduct = self.knowledge_base.find_reduct({"P", "Q", "R"})
+        assert reduct in frozenset({frozenset({"P", "Q"}), frozenset({"P", "R"})})
+        assert self.knowledge_base.find_reduct("P") == frozenset({"P"})
+
+    def test_reduct_of_relations_that_are_not_partitions(self) -> None:
+        """
+        Test that a single reduct preserves the knowledge when a relation does not partition the
+        related elements, where a subset may have as many equivalence classes but other ones.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughOperations()
+        knowledge_base.set_granules([0, 1, 2], tags="element")
+        knowledge_base.add_parent_relation("r0", ({0, 1},))
+        knowledge_base.add_parent_relation("r1", ({1}, {2}))
+        assert knowledge_base.find_reduct({"r0", "r1"}) == frozenset({"r0", "r1"})
+
+    def test_reducts_via_discernibility(self) -> None:
+        """
+        Test that the reducts found with the discernibility matrix are the same as those of
+        find_reducts when the core is not empty.
+
+        Returns:
+            None
+        """
+        assert self.knowledge_base.find_reducts_via_discernibility(
+            {"P", "Q", "R"}
+        ) == frozenset({frozenset({"P", "Q"}), frozenset({"P", "R"})})
+        assert self.knowledge_base.find_reducts_via_discernibility("P") == frozenset(
+            {frozenset({"P"})}
+        )
+
+    def test_reducts_via_discernibility_with_an_empty_core(self) -> None:
+        """
+        Test that the reducts found with the discernibility matrix are those of the literature
+        when the core is empty, whereas find_reducts finds none (see
+        find_reducts_via_discernibility).
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughOperations()
+        knowledge_base.set_granules([0, 1, 2, 3], tags="element")
+        # any two of the relations discern every element, but neither of them is indispensable
+        knowledge_base.add_parent_relation("r0", ({0, 1}, {2, 3}))
+        knowledge_base.add_parent_relation("r1", ({0, 2}, {1, 3}))
+        knowledge_base.add_parent_relation("r2", ({0, 3}, {1, 2}))
+        relations = {"r0", "r1", "r2"}
+        assert knowledge_base.find_reducts(relations) == frozenset()
+        assert knowledge_base.find_reducts_via_discernibility(relations) == frozenset(
+            {
+                frozenset({"r0", "r1"}),
+                frozenset({"r0", "r2"}),
+                frozenset({"r1", "r2"}),
+            }
+        )
+
     def test_core(self) -> None:
         """
         Test that the core is correctly calculated.
@@ -210,20 +308,24 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
     Example 2 on page 36
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
-        self.knowledge_base = RoughOperations()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.knowledge_base.add_parent_relation(
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = [f"x{i}" for i in range(1, 9)]
+        cls.relations = frozenset({"P", "Q", "R"})
+        cls.relations_without_p = cls.relations - {"P"}
+        cls.relations_without_q = cls.relations - {"Q"}
+        cls.relations_without_r = cls.relations - {"R"}
+        cls.knowledge_base = RoughOperations()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.knowledge_base.add_parent_relation(
             "P",
             {frozenset({"x1", "x3", "x4", "x5", "x6", "x7"}), frozenset({"x2", "x8"})},
         )
-        self.knowledge_base.add_parent_relation(
+        cls.knowledge_base.add_parent_relation(
             "Q",
             {frozenset({"x1", "x3", "x4", "x5"}), frozenset({"x2", "x6", "x7", "x8"})},
         )
-        self.knowledge_base.add_parent_relation(
+        cls.knowledge_base.add_parent_relation(
             "R",
             {
                 frozenset({"x1", "x5", "x6"}),
@@ -231,7 +333,7 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
                 frozenset({"x3", "x4"}),
             },
         )
-        self.knowledge_base.add_parent_relation(
+        cls.knowledge_base.add_parent_relation(
             "S",
             {
                 frozenset({"x1", "x5", "x6"}),
@@ -249,19 +351,12 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
         Returns:
             None
         """
-        assert self.knowledge_base.indiscernibility({"P", "Q", "R"}) == frozenset(
-            {
-                frozenset({"x1", "x5"}),
-                frozenset({"x3", "x4"}),
-                frozenset({"x2", "x8"}),
-                frozenset({"x6"}),
-                frozenset({"x7"}),
-            }
-        )
+        assert self.knowledge_base.indiscernibility(self.relations) == _IND_PQR
 
-        assert self.knowledge_base.find_relative_positive_region(
-            {"P", "Q", "R"}, {"S"}
-        ) == frozenset({"x1", "x3", "x4", "x5", "x6", "x7"})
+        assert (
+            self.knowledge_base.find_relative_positive_region(self.relations, {"S"})
+            == _POS_PQR
+        )
 
     def test_relation_p_is_indispensable(self) -> None:
         """
@@ -271,26 +366,21 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
             None
         """
         equivalence_classes = self.knowledge_base.indiscernibility(
-            {"P", "Q", "R"} - {"P"}
-        )
-        assert equivalence_classes == frozenset(
-            {
-                frozenset({"x1", "x5"}),
-                frozenset({"x3", "x4"}),
-                frozenset({"x2", "x7", "x8"}),
-                frozenset({"x6"}),
-            }
+            self.relations_without_p
         )
+        assert equivalence_classes == _IND_QR
 
-        assert self.knowledge_base.find_relative_positive_region(
-            {"P", "Q", "R"} - {"P"}, {"S"}
-        ) == frozenset({"x1", "x3", "x4", "x5", "x6"})
-        assert self.knowledge_base.find_relative_positive_region(
-            {"P", "Q", "R"} - {"P"}, {"S"}
-        ) != self.knowledge_base.find_relative_positive_region({"P", "Q", "R"}, {"S"})
+        positive_region = self.knowledge_base.find_relative_positive_region(
+            self.relations, {"S"}
+        )
+        positive_region_without_p = self.knowledge_base.find_relative_positive_region(
+            self.relations_without_p, {"S"}
+        )
+        assert positive_region_without_p == _POS_QR
+        assert positive_region_without_p != positive_region
         # hence, P is S-indispensible in {'P', 'Q', 'R'}
         assert not self.knowledge_base.dispensable(
-            {"P", "Q", "R"},
+            self.relations,
             {"P"},
             relative_to={"S"},
             mode=self.knowledge_base.find_relative_positive_region,
@@ -304,26 +394,21 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
             None
         """
         equivalence_classes = self.knowledge_base.indiscernibility(
-            {"P", "Q", "R"} - {"Q"}
-        )
-        assert equivalence_classes == frozenset(
-            {
-                frozenset({"x1", "x5", "x6"}),
-                frozenset({"x3", "x4"}),
-                frozenset({"x2", "x8"}),
-                frozenset({"x7"}),
-            }
+            self.relations_without_q
         )
+        assert equivalence_classes == _IND_PR
 
-        assert self.knowledge_base.find_relative_positive_region(
-            {"P", "Q", "R"} - {"Q"}, {"S"}
-        ) == frozenset({"x1", "x3", "x4", "x5", "x6", "x7"})
-        assert self.knowledge_base.find_relative_positive_region(
-            {"P", "Q", "R"} - {"Q"}, {"S"}
-        ) == self.knowledge_base.find_relative_positive_region({"P", "Q", "R"}, {"S"})
+        positive_region = self.knowledge_base.find_relative_positive_region(
+            self.relations, {"S"}
+        )
+        positive_region_without_q = self.knowledge_base.find_relative_positive_region(
+            self.relations_without_q, {"S"}
+        )
+        assert positive_region_without_q == _POS_PQR
+        assert positive_region_without_q == positive_region
         # hence, Q is S-dispensible in {'P', 'Q', 'R'}
         assert self.knowledge_base.dispensable(
-            {"P", "Q", "R"},
+            self.relations,
             {"Q"},
             relative_to={"S"},
             mode=self.knowledge_base.find_relative_positive_region,
@@ -337,28 +422,21 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
             None
         """
         equivalence_classes = self.knowledge_base.indiscernibility(
-            {"P", "Q", "R"} - {"R"}
-        )
-        assert equivalence_classes == frozenset(
-            {
-                frozenset({"x1", "x3", "x4", "x5"}),
-                frozenset({"x2", "x8"}),
-                frozenset({"x6", "x7"}),
-            }
+            self.relations_without_r
         )
+        assert equivalence_classes == _IND_PQ
 
-        assert (
-            self.knowledge_base.find_relative_positive_region(
-                {"P", "Q", "R"} - {"R"}, {"S"}
-            )
-            == frozenset()
+        positive_region = self.knowledge_base.find_relative_positive_region(
+            self.relations, {"S"}
+        )
+        positive_region_without_r = self.knowledge_base.find_relative_positive_region(
+            self.relations_without_r, {"S"}
         )
-        assert self.knowledge_base.find_relative_positive_region(
-            {"P", "Q", "R"} - {"R"}, {"S"}
-        ) != self.knowledge_base.find_relative_positive_region({"P", "Q", "R"}, {"S"})
+        assert positive_region_without_r == frozenset()
+        assert positive_region_without_r != positive_region
         # hence, R is S-indispensible in {'P', 'Q', 'R'}
         assert not self.knowledge_base.dispensable(
-            {"P", "Q", "R"},
+            self.relations,
             {"R"},
             relative_to={"S"},
             mode=self.knowledge_base.find_relative_positive_region,
@@ -371,11 +449,9 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
         Returns:
             None
         """
-        relations = {"P", "Q", "R"}
+        relations = self.relations
         # assert self.gg.Q_CORE(relations, self.gg.POS, {'S'}) == frozenset({'P', 'R'})
-        assert self.knowledge_base.find_core(relations, relative_to={"S"}) == frozenset(
-            {"P", "R"}
-        )
+        assert self.knowledge_base.find_core(relations, relative_to={"S"}) == _S_REDUCT
 
     def test_reduct(self) -> None:
         """
@@ -384,10 +460,16 @@ class TestRelativeReductAndRelativeCore(unittest.TestCase):
         Returns:
             None
         """
-        relations = {"P", "Q", "R"}
+        relations = self.relations
         assert self.knowledge_base.find_reducts(
             relations, relative_to={"S"}
-        ) == frozenset({frozenset({"P", "R"})})
+        ) == frozenset({_S_REDUCT})
+        assert (
+            self.knowledge_base.find_reduct(relations, relative_to={"S"}) == _S_REDUCT
+        )
+        assert self.knowledge_base.find_reducts_via_discernibility(
+            relations, relative_to={"S"}
+        ) == frozenset({_S_REDUCT})
 
 
 class TestReductionOfCategories(unittest.TestCase):
@@ -395,11 +477,53 @@ class TestReductionOfCategories(unittest.TestCase):
     Tests various operations work as intended when involving a family intersection/union.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
-        self.knowledge_base = RoughOperations()
-        self.knowledge_base.set_granules(self.universe, tags="element")
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = [f"x{i}" for i in range(1, 9)]
+        cls.universe_set = frozenset(cls.universe)
+        cls.family = frozenset({"X", "Y", "Z"})
+        cls.family_without_x = cls.family - {"X"}
+        cls.family_without_y = cls.family - {"Y"}
+        cls.family_without_z = cls.family - {"Z"}
+        cls.union_family = frozenset({"X", "Y", "Z", "T"})
+        cls.union_family_without_x = cls.union_family - {"X"}
+        cls.union_family_without_y = cls.union_family - {"Y"}
+        cls.union_family_without_z = cls.union_family - {"Z"}
+        cls.union_family_without_t = cls.union_family - {"T"}
+        # the family of categories for the family intersection (page 39 and 40 of the book)
+        cls.knowledge_base = RoughOperations()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
+        cls.knowledge_base.add_parent_relation(
+            "Y", {frozenset({"x1", "x3", "x4", "x5", "x6"})}
+        )
+        cls.knowledge_base.add_parent_relation(
+            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
+        )
+        cls.knowledge_base.add_parent_relation("T", {frozenset({"x1", "x3", "x8"})})
+        cls.knowledge_base.add_parent_relation(
+            "F",
+            {
+                frozenset({"x1", "x3", "x8"}),
+                frozenset({"x1", "x3", "x4", "x5", "x6"}),
+                frozenset({"x1", "x3", "x4", "x6", "x7"}),
+            },
+        )
+        # the family of categories for the family union, where 'Y' and 'T' differ from above
+        cls.union_knowledge_base = RoughOperations()
+        cls.union_knowledge_base.set_granules(cls.universe, tags="element")
+        cls.union_knowledge_base.add_parent_relation(
+            "X", {frozenset({"x1", "x3", "x8"})}
+        )
+        cls.union_knowledge_base.add_parent_relation(
+            "Y", {frozenset({"x1", "x2", "x4", "x5", "x6"})}
+        )
+        cls.union_knowledge_base.add_parent_relation(
+            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
+        )
+        cls.union_knowledge_base.add_parent_relation(
+            "T", {frozenset({"x1", "x2", "x5", "x7"})}
+        )
 
     def test_family_intersection(self) -> None:
         """
@@ -408,33 +532,32 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x3", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-
         # intersection of the family of sets
-        assert self.knowledge_base.family_intersection({"X", "Y", "Z"}) == frozenset(
-            {"x1", "x3"}
+        self.assertSetEqual(
+            self.knowledge_base.family_intersection(self.family), {"x1", "x3"}
         )
 
         # X is indispensable
-        assert self.knowledge_base.family_intersection(
-            {"X", "Y", "Z"} - {"X"}
-        ) == frozenset({"x1", "x3", "x4", "x6"})
+        self.assertSetEqual(
+            self.knowledge_base.family_intersection(self.family_without_x),
+            {"x1", "x3", "x4", "x6"},
+        )
 
         # Y is dispensable
-        assert self.knowledge_base.family_intersection(
-            {"X", "Y", "Z"} - {"Y"}
-        ) == frozenset({"x1", "x3"})
+        self.assertSetEqual(
+            self.knowledge_base.family_intersection(self.family_without_y), {"x1", "x3"}
+        )
 
         # Z is dispensable
-        assert self.knowledge_base.family_intersection(
-            {"X", "Y", "Z"} - {"Z"}
-        ) == frozenset({"x1", "x3"})
+        self.assertSetEqual(
+            self.knowledge_base.family_intersection(self.family_without_z), {"x1", "x3"}
+        )
+
+        # a relation with several categories refers to the union of its categories
+        self.assertSetEqual(
+            self.knowledge_base.family_intersection({"F", "Y"}),
+            {"x1", "x3", "x4", "x5", "x6"},
+        )
 
     def test_family_union(self) -> None:
         """
@@ -443,36 +566,30 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x2", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "T", {frozenset({"x1", "x2", "x5", "x7"})}
-        )
         # intersection of the family of sets
-        assert self.knowledge_base.family_union({"X", "Y", "Z", "T"}) == frozenset(
-            self.universe
+        self.assertSetEqual(
+            self.union_knowledge_base.family_union(self.union_family), self.universe_set
         )
         # X is indispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"X"}
-        ) == frozenset({"x1", "x2", "x3", "x4", "x5", "x6", "x7"})
+        self.assertSetEqual(
+            self.union_knowledge_base.family_union(self.union_family_without_x),
+            {"x1", "x2", "x3", "x4", "x5", "x6", "x7"},
+        )
         # Y is dispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"Y"}
-        ) == frozenset(self.universe)
+        self.assertSetEqual(
+            self.union_knowledge_base.family_union(self.union_family_without_y),
+            self.universe_set,
+        )
         # Z is dispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"Z"}
-        ) == frozenset(self.universe)
+        self.assertSetEqual(
+            self.union_knowledge_base.family_union(self.union_family_without_z),
+            self.universe_set,
+        )
         # T is dispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"T"}
-        ) == frozenset(self.universe)
+        self.assertSetEqual(
+            self.union_knowledge_base.family_union(self.union_family_without_t),
+            self.universe_set,
+        )
 
     def test_dispensable(self) -> None:
         """
@@ -481,27 +598,17 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x3", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-
-        # yields {'x1', 'x3', 'x4', 'x6'}
-        assert not self.knowledge_base.dispensable(
-            {"X", "Y", "Z"}, "X", mode=self.knowledge_base.family_intersection
-        )
-        # yields {'x1', 'x3'}
-        assert self.knowledge_base.dispensable(
-            {"X", "Y", "Z"}, "Y", mode=self.knowledge_base.family_intersection
-        )
-
-        # yields {'x1', 'x3'}
-        assert self.knowledge_base.dispensable(
-            {"X", "Y", "Z"}, "Z", mode=self.knowledge_base.family_intersection
-        )
+        # X yields {'x1', 'x3', 'x4', 'x6'} and both Y and Z yield {'x1', 'x3'}
+        for relation, dispensable in (("X", False), ("Y", True), ("Z", True)):
+            with self.subTest(relation=relation):
+                assert (
+                    self.knowledge_base.dispensable(
+                        self.family,
+                        relation,
+                        mode=self.knowledge_base.family_intersection,
+                    )
+                    == dispensable
+                )
 
     def test_dependent(self) -> None:
         """
@@ -510,23 +617,8 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x3", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "F",
-            {
-                frozenset({"x1", "x3", "x8"}),
-                frozenset({"x1", "x3", "x4", "x5", "x6"}),
-                frozenset({"x1", "x3", "x4", "x6", "x7"}),
-            },
-        )
         assert not self.knowledge_base.independent(
-            {"X", "Y", "Z"}, mode=self.knowledge_base.family_intersection
+            self.family, mode=self.knowledge_base.family_intersection
         )
 
     def test_reducts_and_core(self) -> None:
@@ -536,26 +628,11 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x3", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "F",
-            {
-                frozenset({"x1", "x3", "x8"}),
-                frozenset({"x1", "x3", "x4", "x5", "x6"}),
-                frozenset({"x1", "x3", "x4", "x6", "x7"}),
-            },
-        )
         assert self.knowledge_base.find_reducts(
-            {"X", "Y", "Z"}, mode=self.knowledge_base.family_intersection
+            self.family, mode=self.knowledge_base.family_intersection
         ) == frozenset({frozenset({"X", "Z"}), frozenset({"Y", "X"})})
         assert self.knowledge_base.find_core(
-            {"X", "Y", "Z"}, mode=self.knowledge_base.family_intersection
+            self.family, mode=self.knowledge_base.family_intersection
         ) == frozenset({"X"})
 
     def test_family_union_dispensable(self) -> None:
@@ -565,53 +642,22 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x2", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "T", {frozenset({"x1", "x2", "x5", "x7"})}
-        )
-
-        # intersection of the family of sets
-        assert self.knowledge_base.family_union({"X", "Y", "Z", "T"}) == frozenset(
-            self.universe
-        )
-
-        # X is indispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"X"}
-        ) == frozenset({"x1", "x2", "x3", "x4", "x5", "x6", "x7"})
-        assert not self.knowledge_base.dispensable(
-            {"X", "Y", "Z", "T"}, "X", mode=self.knowledge_base.family_union
-        )
-
-        # Y is dispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"Y"}
-        ) == frozenset(self.universe)
-        assert self.knowledge_base.dispensable(
-            {"X", "Y", "Z", "T"}, "Y", mode=self.knowledge_base.family_union
-        )
-
-        # Z is dispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"Z"}
-        ) == frozenset(self.universe)
-        assert self.knowledge_base.dispensable(
-            {"X", "Y", "Z", "T"}, "Z", mode=self.knowledge_base.family_union
-        )
-
-        # T is dispensable
-        assert self.knowledge_base.family_union(
-            {"X", "Y", "Z", "T"} - {"T"}
-        ) == frozenset(self.universe)
-        assert self.knowledge_base.dispensable(
-            {"X", "Y", "Z", "T"}, "T", mode=self.knowledge_base.family_union
-        )
+        # the family unions without each relation are checked in test_family_union
+        for relation, dispensable in (
+            ("X", False),
+            ("Y", True),
+            ("Z", True),
+            ("T", True),
+        ):
+            with self.subTest(relation=relation):
+                assert (
+                    self.union_knowledge_base.dispensable(
+                        self.union_family,
+                        relation,
+                        mode=self.union_knowledge_base.family_union,
+                    )
+                    == dispensable
+                )
 
     def test_indispensable(self) -> None:
         """
@@ -620,17 +666,11 @@ class TestReductionOfCategories(unittest.TestCase):
         Returns:
             None
         """
-        self.knowledge_base.add_parent_relation("X", {frozenset({"x1", "x3", "x8"})})
-        self.knowledge_base.add_parent_relation(
-            "Y", {frozenset({"x1", "x3", "x4", "x5", "x6"})}
-        )
-        self.knowledge_base.add_parent_relation(
-            "Z", {frozenset({"x1", "x3", "x4", "x6", "x7"})}
-        )
-        self.knowledge_base.add_parent_relation("T", {frozenset({"x1", "x3", "x8"})})
-        set_f = {"X", "Y", "Z"}
+        set_f = self.family
 
-        assert self.knowledge_base.family_intersection(set_f) == frozenset({"x1", "x3"})
+        self.assertSetEqual(
+            self.knowledge_base.family_intersection(set_f), {"x1", "x3"}
+        )
         assert not self.knowledge_base.y_dispensable(
             set_f, "T", "X"
         )  # X is T-indispensable
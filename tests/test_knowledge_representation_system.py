@@ -4,27 +4,53 @@ calculations of cores, reducts, dispensability, etc.
 """
 
 import unittest
-from typing import Union, Type, Tuple, List
+from functools import lru_cache
+from typing import Union, Type, Tuple
 
 from rough.decisions import RoughDecisions
 from rough.operations import RoughOperations
 
-
+# expected partitions that are checked by more than one test (see make_example)
+_IND_AB = frozenset(
+    (
+        frozenset((1, 5)),
+        frozenset((2, 8)),
+        frozenset((3,)),
+        frozenset((4,)),
+        frozenset((6,)),
+        frozenset((7,)),
+    )
+)
+_IND_DE = frozenset(
+    (
+        frozenset((1,)),
+        frozenset((2, 7)),
+        frozenset((3, 6)),
+        frozenset((4,)),
+        frozenset((5, 8)),
+    )
+)
+
+
+@lru_cache(maxsize=None)
 def make_example(
-    class_to_test: Union[Type[RoughOperations], Type[RoughDecisions]]
-) -> Tuple[List[int], Union[RoughOperations, RoughDecisions]]:
+    class_to_test: Union[Type[RoughOperations], Type[RoughDecisions]],
+) -> Tuple[Tuple[int, ...], Union[RoughOperations, RoughDecisions]]:
     """
     Make an example that is commonly used between different test scenarios.
 
     Note: RoughDecisions is required for other unit tests that use this same example.
 
+    The example is built once per class and the same objects are returned on every later call,
+    so callers must treat them as read-only (copy.deepcopy them before mutating).
+
     Args:
         class_to_test: The class to test, either RoughOperations or RoughDecisions.
 
     Returns:
-        universe of discourse (frozenset), RoughOperations or RoughDecisions
+        universe of discourse (tuple), RoughOperations or RoughDecisions
     """
-    universe = list(range(1, 9))
+    universe = tuple(range(1, 9))
     knowledge_base = class_to_test()
     knowledge_base.set_granules(universe, tags="element")
     knowledge_base.add_parent_relation("a", ({2, 8}, {1, 4, 5}, {3, 6, 7}))
@@ -40,9 +66,9 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
     Test the RoughOperations correctly handles various functionality such as cores, reducts, etc.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe, self.knowledge_base = make_example(class_to_test=RoughOperations)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe, cls.knowledge_base = make_example(class_to_test=RoughOperations)
 
     def test_exemplary_partitions(self) -> None:
         """
@@ -148,6 +174,25 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
         # only one core in the set set_c
         assert self.knowledge_base.find_core(set_c) == frozenset({"a", "b"})
 
+    def test_core_in_parallel(self) -> None:
+        """
+        Test that the core and the relative core are the same whether the relations are checked
+        in parallel or not.
+
+        Returns:
+            None
+        """
+        set_c, set_d = {"a", "b", "c"}, {"d", "e"}
+
+        for min_relations in (1, len(set_c) + 1):  # in parallel, and not in parallel
+            with self.subTest(min_relations=min_relations):
+                assert self.knowledge_base.find_core_parallel(
+                    set_c, workers=2, min_relations=min_relations
+                ) == frozenset({"a", "b"})
+                assert self.knowledge_base.find_core_parallel(
+                    set_c, set_d, workers=2, min_relations=min_relations
+                ) == frozenset({"a"})
+
     def test_dependency(self) -> None:
         """
         Test that dependency is correctly calculated.
@@ -158,14 +203,7 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
         # since {'a', 'b'} are the reduct & core of set set_c,
         # then we have the dependency: {'a', 'b'} ==> {'c'}
         assert self.knowledge_base.depends_on({"a", "b"}, {"c"})
-        assert self.knowledge_base.indiscernibility({"a", "b"}) == {
-            frozenset({1, 5}),
-            frozenset({2, 8}),
-            frozenset({3}),
-            frozenset({4}),
-            frozenset({6}),
-            frozenset({7}),
-        }
+        assert self.knowledge_base.indiscernibility({"a", "b"}) == _IND_AB
         assert self.knowledge_base.indiscernibility({"c"}) == {
             frozenset({1, 5}),
             frozenset({2, 7, 8}),
@@ -181,7 +219,7 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
         """
         set_c, set_d = {"a", "b", "c"}, {"d", "e"}
         # pylint: disable=R0801
-        # copy of lines 56-65 from test_dependency.test_partial_depends_on
+        # copy of the partitions used by test_dependency.test_partial_depends_on
         set_x_1, set_x_2, set_x_3, set_x_4, set_x_5 = {1}, {2, 7}, {3, 6}, {4}, {5, 8}
         set_y_1, set_y_2, set_y_3, set_y_4, set_y_5, set_y_6 = (
             {1, 5},
@@ -193,30 +231,17 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
         )
         # pylint: enable=R0801
 
-        assert self.knowledge_base.indiscernibility(set_d) == {
-            frozenset(set_x_1),
-            frozenset(set_x_2),
-            frozenset(set_x_3),
-            frozenset(set_x_4),
-            frozenset(set_x_5),
-        }
-
-        assert self.knowledge_base.indiscernibility(set_c) == {
-            frozenset(set_y_1),
-            frozenset(set_y_2),
-            frozenset(set_y_3),
-            frozenset(set_y_4),
-            frozenset(set_y_5),
-            frozenset(set_y_6),
-        }
+        assert self.knowledge_base.indiscernibility(set_d) == _IND_DE
+        # attribute 'c' is dispensable, so IND(set_c) is IND({'a', 'b'})
+        assert self.knowledge_base.indiscernibility(set_c) == _IND_AB
 
         assert self.knowledge_base.lower_approximation(set_c, set_x_1) == frozenset()
         assert self.knowledge_base.lower_approximation(set_c, set_x_2) == frozenset(
             set_y_6
         )
-        assert self.knowledge_base.lower_approximation(set_c, set_x_3) == frozenset(
-            set_y_3.union(set_y_5)
-        )
+        assert self.knowledge_base.lower_approximation(
+            set_c, set_x_3
+        ) == frozenset().union(set_y_3, set_y_5)
         assert self.knowledge_base.lower_approximation(set_c, set_x_4) == frozenset(
             set_y_4
         )
@@ -226,7 +251,7 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
         # blocks of the partition U / IND(set_d) using set_c
         assert self.knowledge_base.find_relative_positive_region(
             set_c, set_d
-        ) == frozenset(set_y_3).union(set_y_4, set_y_5, set_y_6)
+        ) == frozenset().union(set_y_3, set_y_4, set_y_5, set_y_6)
 
         assert self.knowledge_base.partial_depends_on(set_c, set_d) == 0.5
 
@@ -273,21 +298,8 @@ class TestKnowledgeRepresentationSystem(unittest.TestCase):
             frozenset({4}),
             frozenset({7}),
         }
-        assert self.knowledge_base.indiscernibility({"a", "b"}) == {
-            frozenset({1, 5}),
-            frozenset({2, 8}),
-            frozenset({3}),
-            frozenset({4}),
-            frozenset({6}),
-            frozenset({7}),
-        }
-        assert self.knowledge_base.indiscernibility({"d", "e"}) == {
-            frozenset({1}),
-            frozenset({2, 7}),
-            frozenset({3, 6}),
-            frozenset({4}),
-            frozenset({5, 8}),
-        }
+        assert self.knowledge_base.indiscernibility({"a", "b"}) == _IND_AB
+        assert self.knowledge_base.indiscernibility({"d", "e"}) == _IND_DE
 
         assert self.knowledge_base.find_relative_positive_region(
             set_c - {"a"}, set_d
@@ -3,13 +3,37 @@ Test the equivalence relation, indiscernibility, rough equality, and rough inclu
 """
 
 import unittest
-from typing import List
+from typing import Sequence
 
 from rough.approximation import RoughApproximation
+from rough.granulation import QUERY_CACHE_SIZE
+
+# the universes of discourse of the examples
+_UNIVERSE_8 = tuple(f"x{i}" for i in range(1, 9))
+_UNIVERSE_9 = tuple(f"x{i}" for i in range(1, 10))
+
+# the categories of the relations of the example on page 4 (see example_knowledge_base)
+_R1 = frozenset(
+    (
+        frozenset(("x1", "x3", "x7")),
+        frozenset(("x2", "x4")),
+        frozenset(("x5", "x6", "x8")),
+    )
+)
+_R2 = frozenset(
+    (
+        frozenset(("x1", "x5")),
+        frozenset(("x2", "x6")),
+        frozenset(("x3", "x4", "x7", "x8")),
+    )
+)
+_R3 = frozenset(
+    (frozenset(("x2", "x7", "x8")), frozenset(("x1", "x3", "x4", "x5", "x6")))
+)
 
 
 def example_knowledge_base(
-    knowledge_base: RoughApproximation, universe: List[str]
+    knowledge_base: RoughApproximation, universe: Sequence[str]
 ) -> None:
     """
     Apply granules and relations in-place to an example RoughApproximation object. Page 4 in book.
@@ -22,15 +46,9 @@ def example_knowledge_base(
         None
     """
     knowledge_base.set_granules(universe, tags="element")
-    knowledge_base.add_parent_relation(
-        "R1", ({"x1", "x3", "x7"}, {"x2", "x4"}, {"x5", "x6", "x8"})
-    )
-    knowledge_base.add_parent_relation(
-        "R2", ({"x1", "x5"}, {"x2", "x6"}, {"x3", "x4", "x7", "x8"})
-    )
-    knowledge_base.add_parent_relation(
-        "R3", ({"x2", "x7", "x8"}, {"x1", "x3", "x4", "x5", "x6"})
-    )
+    knowledge_base.add_parent_relation("R1", _R1)
+    knowledge_base.add_parent_relation("R2", _R2)
+    knowledge_base.add_parent_relation("R3", _R3)
 
 
 class TestEquivalenceRelation(unittest.TestCase):
@@ -38,9 +56,9 @@ class TestEquivalenceRelation(unittest.TestCase):
     Test the equivalence relation.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = _UNIVERSE_8
 
     def test_get_category(self) -> None:
         """
@@ -52,26 +70,10 @@ class TestEquivalenceRelation(unittest.TestCase):
         knowledge_base = RoughApproximation()
         example_knowledge_base(knowledge_base, self.universe)
 
-        # test that the equivalence relation is correctly stored.
-        assert knowledge_base / "R1" == frozenset(
-            {
-                frozenset({"x8", "x6", "x5"}),
-                frozenset({"x3", "x7", "x1"}),
-                frozenset({"x2", "x4"}),
-            }
-        )
-        # test that the equivalence relation is correctly stored.
-        assert knowledge_base / "R2" == frozenset(
-            {
-                frozenset({"x2", "x6"}),
-                frozenset({"x1", "x5"}),
-                frozenset({"x3", "x8", "x4", "x7"}),
-            }
-        )
-        # test that the equivalence relation is correctly stored.
-        assert knowledge_base / "R3" == frozenset(
-            {frozenset({"x2", "x8", "x7"}), frozenset({"x1", "x4", "x5", "x3", "x6"})}
-        )
+        # test that the equivalence relations are correctly stored.
+        assert knowledge_base / "R1" == _R1
+        assert knowledge_base / "R2" == _R2
+        assert knowledge_base / "R3" == _R3
 
         expected_indexing_result = {
             "R1": frozenset({"x3", "x1", "x7"}),
@@ -93,14 +95,14 @@ class TestEquivalenceRelation(unittest.TestCase):
         ) == frozenset({"x8"})
 
         assert knowledge_base["x1"]["R1"].intersection(
-            knowledge_base["x3"]["R2"]
-        ).intersection(knowledge_base["x2"]["R3"]) == frozenset({"x7"})
+            knowledge_base["x3"]["R2"], knowledge_base["x2"]["R3"]
+        ) == frozenset({"x7"})
         assert knowledge_base["x2"]["R1"].intersection(
-            knowledge_base["x2"]["R2"]
-        ).intersection(knowledge_base["x2"]["R3"]) == frozenset({"x2"})
+            knowledge_base["x2"]["R2"], knowledge_base["x2"]["R3"]
+        ) == frozenset({"x2"})
         assert knowledge_base["x5"]["R1"].intersection(
-            knowledge_base["x3"]["R2"]
-        ).intersection(knowledge_base["x2"]["R3"]) == frozenset({"x8"})
+            knowledge_base["x3"]["R2"], knowledge_base["x2"]["R3"]
+        ) == frozenset({"x8"})
 
         assert knowledge_base["x1"]["R1"].union(
             knowledge_base["x2"]["R1"]
@@ -126,15 +128,29 @@ class TestEquivalenceRelation(unittest.TestCase):
             == frozenset()
         )
 
+    def test_unknown_element(self) -> None:
+        """
+        Test that a relation may only refer to elements that have been added.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        example_knowledge_base(knowledge_base, self.universe)
+
+        self.assertRaises(
+            ValueError, knowledge_base.add_parent_relation, "R4", ({"x1", "x9"},)
+        )
+
 
 class TestIndiscernibilityRelation(unittest.TestCase):
     """
     Test the indiscernibility relation.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 10)]
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = _UNIVERSE_9
 
     def test_indiscernibility(self) -> None:
         """
@@ -159,24 +175,177 @@ class TestIndiscernibilityRelation(unittest.TestCase):
             frozenset({"x8"}),
         }
 
+    def test_indiscernibility_of_a_single_relation(self) -> None:
+        """
+        Test that a single relation may be given by its name, even if the name has more than one
+        character.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        example_knowledge_base(knowledge_base, self.universe)
+
+        assert knowledge_base.indiscernibility("R1") == _R1
+        assert knowledge_base.indiscernibility({"R1"}) == _R1
+        category = frozenset(("x2", "x7", "x8"))
+        assert knowledge_base.lower_approximation("R3", category) == category
+
+    def test_indiscernibility_shares_blocks(self) -> None:
+        """
+        Test that equal blocks of elements are the same object, whether they are obtained from a
+        relation's categories or from the indiscernibility relation.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        example_knowledge_base(knowledge_base, self.universe)
+
+        categories = {category: category for category in knowledge_base / "R1"}
+        for block in knowledge_base.indiscernibility(["R1"]):
+            assert block is categories[block]
+
+    def test_duplicate_blocks_are_skipped(self) -> None:
+        """
+        Test that a block repeated within a relation is only added once, and that an equal block
+        under another relation is the same object.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        knowledge_base.set_granules(self.universe, tags="element")
+        block = {"x1", "x3", "x7"}
+        knowledge_base.add_parent_relation(
+            "R1", (block, {"x2", "x4"}, set(block), {"x5", "x6", "x8", "x9"})
+        )
+        knowledge_base.add_parent_relation(
+            "R2", (frozenset(block), {"x2", "x4", "x5", "x6", "x8", "x9"})
+        )
+        assert len(knowledge_base / "R1") == 3
+        assert knowledge_base.indiscernibility({"R1", "R2"}) == {
+            frozenset({"x1", "x3", "x7"}),
+            frozenset({"x2", "x4"}),
+            frozenset({"x5", "x6", "x8", "x9"}),
+        }
+        r1_block = next(
+            category for category in knowledge_base / "R1" if category == block
+        )
+        r2_block = next(
+            category for category in knowledge_base / "R2" if category == block
+        )
+        assert r1_block is r2_block
+
+    def test_duplicate_list_blocks_are_skipped(self) -> None:
+        """
+        Test that a repeated block is only added once when the blocks are given as lists.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        knowledge_base.set_granules(["a", "b", "c"], tags="element")
+        vertices = knowledge_base.add_parent_relation("P", (["a"], ["a"], ["b", "c"]))
+        assert len(vertices) == 2
+        assert knowledge_base / "P" == {frozenset({"a"}), frozenset({"b", "c"})}
+
+        # an item that is repeated within a block is kept, as an edge weighted by its frequency
+        knowledge_base.add_parent_relation("Q", (["a", "a"], ["b", "c"]))
+        assert sorted(knowledge_base.graph.es["weight"]) == [1, 1, 1, 1, 1, 2]
+
+    def test_block_pool_only_keeps_relation_blocks(self) -> None:
+        """
+        Test that the blocks obtained from queries (e.g., approximations) are discarded once the
+        knowledge base is modified, rather than being kept with the blocks of the relations.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        example_knowledge_base(knowledge_base, self.universe)
+        for size in range(1, len(self.universe) + 1):
+            knowledge_base.upper_approximation({"R1", "R2"}, set(self.universe[:size]))
+        # pylint: disable=protected-access
+        assert len(knowledge_base._block_pool) == len(_R1 | _R2 | _R3)
+        knowledge_base.set_granules(["x9"], tags="element")
+        assert "block pool" not in knowledge_base._derived
+
+    def test_query_caches_are_bounded(self) -> None:
+        """
+        Test that the results that are cached per category (e.g., approximations) are bounded,
+        rather than growing with each distinct query.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        universe = [f"x{i}" for i in range(12)]
+        knowledge_base.set_granules(universe, tags="element")
+        knowledge_base.add_parent_relation(
+            "P", [universe[index : index + 2] for index in range(0, 12, 2)]
+        )
+        for bits in range(1, 2**12):
+            category = {
+                item for index, item in enumerate(universe) if bits >> index & 1
+            }
+            assert category <= knowledge_base.upper_approximation("P", category)
+        # pylint: disable=protected-access
+        for cache in knowledge_base._derived.values():
+            if hasattr(cache, "__len__"):
+                assert len(cache) <= QUERY_CACHE_SIZE
+
+    def test_indiscernibility_after_adding_relation(self) -> None:
+        """
+        Test the indiscernibility relation is recalculated once the knowledge base is modified,
+        rather than a previously calculated (i.e., cached) result being returned.
+
+        Returns:
+            None
+        """
+        knowledge_base = RoughApproximation()
+        knowledge_base.set_granules(self.universe, tags="element")
+        knowledge_base.add_parent_relation(
+            "R1", ({"x1", "x3", "x7"}, {"x2", "x4"}, {"x5", "x6", "x8", "x9"})
+        )
+        assert knowledge_base.indiscernibility({"R1"}) == {
+            frozenset({"x1", "x3", "x7"}),
+            frozenset({"x2", "x4"}),
+            frozenset({"x5", "x6", "x8", "x9"}),
+        }
+
+        # a new element is given its own category under the same relation
+        knowledge_base.set_granules(["x10"], tags="element")
+        knowledge_base.add_parent_relation("R1", ({"x10"},))
+        assert knowledge_base.indiscernibility({"R1"}) == {
+            frozenset({"x1", "x3", "x7"}),
+            frozenset({"x2", "x4"}),
+            frozenset({"x5", "x6", "x8", "x9"}),
+            frozenset({"x10"}),
+        }
+        assert len(knowledge_base / "R1") == 4
+
 
 class TestRoughEqualityOfSets(unittest.TestCase):
     """
     Test the rough equality of sets.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
-        self.knowledge_base = RoughApproximation()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.set_e_1 = {"x2", "x3"}
-        self.set_e_2 = {"x1", "x4", "x5"}
-        self.set_e_3 = {"x6"}
-        self.set_e_4 = {"x7", "x8"}
-        self.knowledge_base.add_parent_relation(
-            "R", (self.set_e_1, self.set_e_2, self.set_e_3, self.set_e_4)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = _UNIVERSE_8
+        cls.knowledge_base = RoughApproximation()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.set_e_1 = frozenset({"x2", "x3"})
+        cls.set_e_2 = frozenset({"x1", "x4", "x5"})
+        cls.set_e_3 = frozenset({"x6"})
+        cls.set_e_4 = frozenset({"x7", "x8"})
+        cls.knowledge_base.add_parent_relation(
+            "R", (cls.set_e_1, cls.set_e_2, cls.set_e_3, cls.set_e_4)
         )
+        # unions of the R-basic categories that the assertions below expect
+        cls.set_e_123 = cls.set_e_1 | cls.set_e_2 | cls.set_e_3
+        cls.set_e_124 = cls.set_e_1 | cls.set_e_2 | cls.set_e_4
 
     def test_bottom_rough_equal(self) -> None:
         """
@@ -188,13 +357,9 @@ class TestRoughEqualityOfSets(unittest.TestCase):
         set_x_1 = frozenset({"x1", "x2", "x3"})
         set_x_2 = frozenset({"x2", "x3", "x7"})
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_x_1) == frozenset(
-            self.set_e_1
-        )
+        assert self.knowledge_base.lower_approximation("R", set_x_1) == self.set_e_1
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_x_2) == frozenset(
-            self.set_e_1
-        )
+        assert self.knowledge_base.lower_approximation("R", set_x_2) == self.set_e_1
         # test that the rough bottom equality is calculated correctly for the given sets,
         # since the lower approximation of both sets is the same, they are bottom-roughly equal
         assert self.knowledge_base.roughly_equal("R", set_x_1, set_x_2, mode="bottom")
@@ -209,13 +374,9 @@ class TestRoughEqualityOfSets(unittest.TestCase):
         set_y_1 = frozenset({"x1", "x2", "x7"})
         set_y_2 = frozenset({"x2", "x3", "x4", "x8"})
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_y_1) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_4)
+        assert self.knowledge_base.upper_approximation("R", set_y_1) == self.set_e_124
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_y_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_4)
+        assert self.knowledge_base.upper_approximation("R", set_y_2) == self.set_e_124
         # test that the rough top equality is calculated correctly, since the upper approximation
         # of the first set is equal to the upper approximation of the second set, then the sets
         # are top-roughly equal
@@ -231,21 +392,13 @@ class TestRoughEqualityOfSets(unittest.TestCase):
         set_z_1 = frozenset({"x1", "x2", "x6"})
         set_z_2 = frozenset({"x3", "x4", "x6"})
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_z_1) == frozenset(
-            self.set_e_3
-        )
+        assert self.knowledge_base.lower_approximation("R", set_z_1) == self.set_e_3
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_z_2) == frozenset(
-            self.set_e_3
-        )
+        assert self.knowledge_base.lower_approximation("R", set_z_2) == self.set_e_3
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_z_1) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_3)
+        assert self.knowledge_base.upper_approximation("R", set_z_1) == self.set_e_123
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_z_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_3)
+        assert self.knowledge_base.upper_approximation("R", set_z_2) == self.set_e_123
         # test that the rough equality is calculated correctly, since the lower and upper
         # approximations are equal, the sets are roughly equal
         assert self.knowledge_base.roughly_equal("R", set_z_1, set_z_2)
@@ -274,18 +427,22 @@ class TestRoughInclusionOfSets(unittest.TestCase):
     Test the rough inclusion of sets.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
-        self.knowledge_base = RoughApproximation()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.set_e_1 = {"x2", "x3"}
-        self.set_e_2 = {"x1", "x4", "x5"}
-        self.set_e_3 = {"x6"}
-        self.set_e_4 = {"x7", "x8"}
-        self.knowledge_base.add_parent_relation(
-            "R", (self.set_e_1, self.set_e_2, self.set_e_3, self.set_e_4)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = _UNIVERSE_8
+        cls.knowledge_base = RoughApproximation()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.set_e_1 = frozenset({"x2", "x3"})
+        cls.set_e_2 = frozenset({"x1", "x4", "x5"})
+        cls.set_e_3 = frozenset({"x6"})
+        cls.set_e_4 = frozenset({"x7", "x8"})
+        cls.knowledge_base.add_parent_relation(
+            "R", (cls.set_e_1, cls.set_e_2, cls.set_e_3, cls.set_e_4)
         )
+        # unions of the R-basic categories that the assertions below expect
+        cls.set_e_13 = cls.set_e_1 | cls.set_e_3
+        cls.set_e_14 = cls.set_e_1 | cls.set_e_4
+        cls.set_e_124 = cls.set_e_1 | cls.set_e_2 | cls.set_e_4
 
     def test_bottom_rough_included(self) -> None:
         """
@@ -297,13 +454,9 @@ class TestRoughInclusionOfSets(unittest.TestCase):
         set_x_1 = frozenset({"x2", "x4", "x6", "x7"})
         set_x_2 = frozenset({"x2", "x3", "x4", "x6"})
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_x_1) == frozenset(
-            self.set_e_3
-        )
+        assert self.knowledge_base.lower_approximation("R", set_x_1) == self.set_e_3
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_x_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_3)
+        assert self.knowledge_base.lower_approximation("R", set_x_2) == self.set_e_13
         # test that the rough bottom inclusion is calculated correctly, since the lower
         # approximation of the first set is roughly included in the lower approximation of
         # the second set, then the first set is bottom-roughly included in the second set
@@ -321,13 +474,9 @@ class TestRoughInclusionOfSets(unittest.TestCase):
         set_y_1 = frozenset({"x2", "x3", "x7"})
         set_y_2 = frozenset({"x1", "x2", "x7"})
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_y_1) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_4)
+        assert self.knowledge_base.upper_approximation("R", set_y_1) == self.set_e_14
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_y_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_4)
+        assert self.knowledge_base.upper_approximation("R", set_y_2) == self.set_e_124
         # test that the rough top inclusion is calculated correctly, since the upper
         # approximation of the first set is roughly included in the upper approximation of
         # the second set, then the first set is top-roughly included in the second set
@@ -343,21 +492,13 @@ class TestRoughInclusionOfSets(unittest.TestCase):
         set_z_1 = frozenset({"x2", "x3"})
         set_z_2 = frozenset({"x1", "x2", "x3", "x7"})
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_z_1) == frozenset(
-            self.set_e_1
-        )
+        assert self.knowledge_base.lower_approximation("R", set_z_1) == self.set_e_1
         # test that the lower approximation is calculated correctly for the given set
-        assert self.knowledge_base.lower_approximation("R", set_z_2) == frozenset(
-            self.set_e_1
-        )
+        assert self.knowledge_base.lower_approximation("R", set_z_2) == self.set_e_1
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_z_1) == frozenset(
-            self.set_e_1
-        )
+        assert self.knowledge_base.upper_approximation("R", set_z_1) == self.set_e_1
         # test that the upper approximation is calculated correctly for the given set
-        assert self.knowledge_base.upper_approximation("R", set_z_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_4)
+        assert self.knowledge_base.upper_approximation("R", set_z_2) == self.set_e_124
         # test that the rough inclusion is calculated correctly, since the lower
         # approximation of the first set is roughly included in the lower approximation of
         # the second set and the upper approximation of the first set is roughly included
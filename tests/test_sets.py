@@ -3,28 +3,63 @@ Test the properties of rough sets and equivalence classes.
 """
 
 import unittest
+from typing import Tuple
 
 from rough.approximation import RoughApproximation
 
+# the universe of both examples
+_UNIVERSE = tuple(f"x{i}" for i in range(1, 9))
 
-class TestRoughSets(unittest.TestCase):
+# the R-basic categories of the example on page 13 (see TestRoughSets)
+_SET_E_1 = frozenset(("x1", "x4", "x8"))
+_SET_E_2 = frozenset(("x2", "x5", "x7"))
+_SET_E_3 = frozenset(("x3",))
+_SET_E_4 = frozenset(("x6",))
+
+# the R-basic categories of the classification examples (see TestApproximationOfClassifications)
+_SET_X_1 = frozenset(("x1", "x3", "x5"))
+_SET_X_2 = frozenset(("x2", "x4"))
+_SET_X_3 = frozenset(("x6", "x7", "x8"))
+
+
+class _RoughTestBase(unittest.TestCase):
+    """
+    Build a knowledge base over the universe of the examples once per test class, whose relation
+    'R' has the categories given by the subclass (PARTITION).
+    """
+
+    PARTITION: Tuple[frozenset, ...] = ()
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.universe = _UNIVERSE
+        cls.universe_set = frozenset(_UNIVERSE)
+        cls.knowledge_base = RoughApproximation()
+        cls.knowledge_base.set_granules(cls.universe, tags="element")
+        cls.knowledge_base.add_parent_relation("R", cls.PARTITION)
+
+
+class TestRoughSets(_RoughTestBase):
     """
     Test the properties of rough sets, equivalence classes, and the like, using the example on
     page 13 of "Rough Sets: Theoretical Aspects of Reasoning About Data".
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
-        self.knowledge_base = RoughApproximation()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.set_e_1 = {"x1", "x4", "x8"}
-        self.set_e_2 = {"x2", "x5", "x7"}
-        self.set_e_3 = {"x3"}
-        self.set_e_4 = {"x6"}
-        self.knowledge_base.add_parent_relation(
-            "R", (self.set_e_1, self.set_e_2, self.set_e_3, self.set_e_4)
-        )
+    set_e_1, set_e_2, set_e_3, set_e_4 = _SET_E_1, _SET_E_2, _SET_E_3, _SET_E_4
+    PARTITION = (set_e_1, set_e_2, set_e_3, set_e_4)
+    # unions of the R-basic categories that the assertions below expect
+    set_e_12 = set_e_1 | set_e_2
+    set_e_14 = set_e_1 | set_e_4
+    set_e_34 = set_e_3 | set_e_4
+    set_e_123 = set_e_12 | set_e_3
+    set_e_1234 = set_e_123 | set_e_4
+    # the sets whose regions are tested below, with their expected boundary region, negative
+    # region, accuracy and roughness (see check_examples)
+    examples = (
+        (frozenset(("x1", "x4", "x5")), set_e_12, set_e_34, 0.0, 1),
+        (frozenset(("x3", "x5")), set_e_2, set_e_14, 0.25, 0.75),
+        (frozenset(("x3", "x6", "x8")), set_e_1, set_e_2, 0.4, 0.6),
+    )
 
     def test_equivalence_classes(self) -> None:
         """
@@ -34,14 +69,25 @@ class TestRoughSets(unittest.TestCase):
             None
         """
         assert self.knowledge_base / "R" == frozenset(
-            {
-                frozenset(self.set_e_1),
-                frozenset(self.set_e_2),
-                frozenset(self.set_e_3),
-                frozenset(self.set_e_4),
-            }
+            {self.set_e_1, self.set_e_2, self.set_e_3, self.set_e_4}
         )
 
+    def test_equivalence_class(self) -> None:
+        """
+        Test that the "equivalence class" of each element (i.e., [x]_R) is the category of R that
+        contains it, and that an element outside the universe is rejected.
+
+        Returns:
+            None
+        """
+        for category in self.PARTITION:
+            for element in category:
+                with self.subTest(element=element):
+                    assert (
+                        self.knowledge_base.equivalence_class("R", element) == category
+                    )
+        self.assertRaises(ValueError, self.knowledge_base.equivalence_class, "R", "x9")
+
     def test_lower_approximation(self) -> None:
         """
         Test that the "lower approximation" (i.e., positive region) of a set is correctly
@@ -52,36 +98,24 @@ class TestRoughSets(unittest.TestCase):
         """
         set_x_1 = frozenset({"x1", "x4", "x7"})
         set_x_2 = frozenset({"x2", "x8"})
+        set_x_1_or_2 = set_x_1 | set_x_2
 
-        # test that the lower approximation of a set is the union of the lower approximations
-        # of its elements; test the positive region as well (they should be the same)
-        assert (
-            self.knowledge_base.lower_approximation("R", set_x_1)
-            == self.knowledge_base.positive_region("R", set_x_1)
-            == frozenset()
-        )
-        assert (
-            self.knowledge_base.lower_approximation("R", set_x_2)
-            == self.knowledge_base.positive_region("R", set_x_2)
-            == frozenset()
-        )
+        # the positive region is the same method as the lower approximation
         assert (
-            self.knowledge_base.lower_approximation("R", set_x_1.union(set_x_2))
-            == self.knowledge_base.positive_region("R", set_x_1.union(set_x_2))
-            == frozenset(self.set_e_1)
-        )
-        assert (
-            self.knowledge_base.lower_approximation("R", set_x_1)
-            .union(self.knowledge_base.lower_approximation("R", set_x_2))
-            .issubset(
-                self.knowledge_base.lower_approximation("R", set_x_1.union(set_x_2))
-            )
-        )
-        assert (
-            self.knowledge_base.positive_region("R", set_x_1)
-            .union(self.knowledge_base.positive_region("R", set_x_2))
-            .issubset(self.knowledge_base.positive_region("R", set_x_1.union(set_x_2)))
+            self.knowledge_base.positive_region
+            == self.knowledge_base.lower_approximation
         )
+        lower_1 = self.knowledge_base.lower_approximation("R", set_x_1)
+        lower_2 = self.knowledge_base.lower_approximation("R", set_x_2)
+        lower_1_or_2 = self.knowledge_base.lower_approximation("R", set_x_1_or_2)
+
+        # test that the lower approximation of a set is the union of the lower approximations
+        # of its elements
+        assert lower_1 == frozenset()
+        assert lower_2 == frozenset()
+        assert lower_1_or_2 == self.set_e_1
+        assert self.knowledge_base.positive_region("R", set_x_1_or_2) == self.set_e_1
+        assert lower_1.union(lower_2).issubset(lower_1_or_2)
 
     def test_upper_approximation(self) -> None:
         """
@@ -92,27 +126,38 @@ class TestRoughSets(unittest.TestCase):
         """
         set_y_1 = frozenset({"x1", "x3", "x5"})
         set_y_2 = frozenset({"x2", "x3", "x4", "x6"})
+        set_y_1_and_2 = set_y_1 & set_y_2
 
-        assert self.knowledge_base.upper_approximation(
-            "R", set_y_1.intersection(set_y_2)
-        ) == frozenset(self.set_e_3)
-        assert self.knowledge_base.upper_approximation("R", set_y_1) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_3)
-        assert self.knowledge_base.upper_approximation("R", set_y_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2).union(self.set_e_3).union(self.set_e_4)
-        assert self.knowledge_base.upper_approximation("R", set_y_2) == frozenset(
-            self.universe
+        assert (
+            self.knowledge_base.upper_approximation("R", set_y_1_and_2) == self.set_e_3
+        )
+        assert self.knowledge_base.upper_approximation("R", set_y_1) == self.set_e_123
+        assert self.knowledge_base.upper_approximation("R", set_y_2) == self.set_e_1234
+        assert (
+            self.knowledge_base.upper_approximation("R", set_y_2) == self.universe_set
         )
-        assert self.knowledge_base.upper_approximation(
-            "R", set_y_1.intersection(set_y_2)
-        ).issubset(
+        assert self.knowledge_base.upper_approximation("R", set_y_1_and_2).issubset(
             self.knowledge_base.upper_approximation("R", set_y_1).intersection(
                 self.knowledge_base.upper_approximation("R", set_y_2)
             )
         )
 
+    def check_examples(self, name: str, column: int) -> None:
+        """
+        Check the given method of the knowledge base against a column of the examples.
+
+        Args:
+            name: The name of the method, which takes the relations and a category.
+            column: The column of the examples that holds the expected results.
+
+        Returns:
+            None
+        """
+        method = getattr(self.knowledge_base, name)
+        for example in self.examples:
+            with self.subTest(method=name, category=sorted(example[0])):
+                assert method("R", example[0]) == example[column]
+
     def test_boundary_region(self) -> None:
         """
         Test that the "boundary" of a set is correctly calculated.
@@ -120,19 +165,7 @@ class TestRoughSets(unittest.TestCase):
         Returns:
             None
         """
-        set_x_1 = frozenset({"x1", "x4", "x5"})
-        set_x_2 = frozenset({"x3", "x5"})
-        set_x_3 = frozenset({"x3", "x6", "x8"})
-
-        assert self.knowledge_base.boundary_region("R", set_x_1) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_2)
-        assert self.knowledge_base.boundary_region("R", set_x_2) == frozenset(
-            self.set_e_2
-        )
-        assert self.knowledge_base.boundary_region("R", set_x_3) == frozenset(
-            self.set_e_1
-        )
+        self.check_examples("boundary_region", 1)
 
     def test_negative_region(self) -> None:
         """
@@ -141,19 +174,7 @@ class TestRoughSets(unittest.TestCase):
         Returns:
             None
         """
-        set_x_1 = frozenset({"x1", "x4", "x5"})
-        set_x_2 = frozenset({"x3", "x5"})
-        set_x_3 = frozenset({"x3", "x6", "x8"})
-
-        assert self.knowledge_base.negative_region("R", set_x_1) == frozenset(
-            {"x3", "x6"}
-        )
-        assert self.knowledge_base.negative_region("R", set_x_2) == frozenset(
-            self.set_e_1
-        ).union(self.set_e_4)
-        assert self.knowledge_base.negative_region("R", set_x_3) == frozenset(
-            self.set_e_2
-        )
+        self.check_examples("negative_region", 2)
 
     def test_accuracy(self) -> None:
         """
@@ -162,13 +183,7 @@ class TestRoughSets(unittest.TestCase):
         Returns:
             None
         """
-        set_x_1 = frozenset({"x1", "x4", "x5"})
-        set_x_2 = frozenset({"x3", "x5"})
-        set_x_3 = frozenset({"x3", "x6", "x8"})
-
-        assert self.knowledge_base.accuracy("R", set_x_1) == 0.0
-        assert self.knowledge_base.accuracy("R", set_x_2) == 0.25
-        assert self.knowledge_base.accuracy("R", set_x_3) == 0.4
+        self.check_examples("accuracy", 3)
 
     def test_roughness(self) -> None:
         """
@@ -177,32 +192,20 @@ class TestRoughSets(unittest.TestCase):
         Returns:
             None
         """
-        set_x_1 = frozenset({"x1", "x4", "x5"})
-        set_x_2 = frozenset({"x3", "x5"})
-        set_x_3 = frozenset({"x3", "x6", "x8"})
-
         # this should be the complement of accuracy
-        assert self.knowledge_base.roughness("R", set_x_1) == 1
-        assert self.knowledge_base.roughness("R", set_x_2) == 0.75
-        assert self.knowledge_base.roughness("R", set_x_3) == 0.6
+        self.check_examples("roughness", 4)
 
 
-class TestApproximationOfClassifications(unittest.TestCase):
+class TestApproximationOfClassifications(_RoughTestBase):
     """
     Test classifications using an existing equivalence relation.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.universe = [f"x{i}" for i in range(1, 9)]
-        self.knowledge_base = RoughApproximation()
-        self.knowledge_base.set_granules(self.universe, tags="element")
-        self.set_x_1 = {"x1", "x3", "x5"}
-        self.set_x_2 = {"x2", "x4"}
-        self.set_x_3 = {"x6", "x7", "x8"}
-        self.knowledge_base.add_parent_relation(
-            "R", (self.set_x_1, self.set_x_2, self.set_x_3)
-        )
+    set_x_1, set_x_2, set_x_3 = _SET_X_1, _SET_X_2, _SET_X_3
+    PARTITION = (set_x_1, set_x_2, set_x_3)
+    # unions of the R-basic categories that the assertions below expect
+    set_x_13 = set_x_1 | set_x_3
+    set_x_123 = set_x_13 | set_x_2
 
     def test_classifications_1(self) -> None:
         """
@@ -215,18 +218,16 @@ class TestApproximationOfClassifications(unittest.TestCase):
         set_y_2 = frozenset({"x3", "x5", "x8"})
         set_y_3 = frozenset({"x6", "x7"})
 
-        assert self.knowledge_base.lower_approximation("R", set_y_1) == frozenset(
-            self.set_x_2
-        )
+        assert self.knowledge_base.lower_approximation("R", set_y_1) == self.set_x_2
         assert (
             self.knowledge_base.upper_approximation("R", set_y_2)
-            == frozenset(self.set_x_1).union(self.set_x_3)
-            != frozenset(self.universe)
+            == self.set_x_13
+            != self.universe_set
         )
         assert (
             self.knowledge_base.upper_approximation("R", set_y_3)
-            == frozenset(self.set_x_3)
-            != frozenset(self.universe)
+            == self.set_x_3
+            != self.universe_set
         )
 
     def test_classifications_2(self) -> None:
@@ -242,8 +243,22 @@ class TestApproximationOfClassifications(unittest.TestCase):
 
         assert (
             self.knowledge_base.upper_approximation("R", set_z_1)
-            == frozenset(self.set_x_1).union(self.set_x_2).union(self.set_x_3)
-            == frozenset(self.universe)
+            == self.set_x_123
+            == self.universe_set
         )
         assert self.knowledge_base.lower_approximation("R", set_z_2) == frozenset()
         assert self.knowledge_base.lower_approximation("R", set_z_3) == frozenset()
+
+    def test_category_smaller_than_any_block(self) -> None:
+        """
+        Test that a category with fewer elements than the smallest category of R has an empty
+        lower approximation, while its upper approximation is still found.
+
+        Returns:
+            None
+        """
+        category = frozenset({"x1"})
+
+        assert self.knowledge_base.lower_approximation("R", category) == frozenset()
+        assert self.knowledge_base.upper_approximation("R", category) == self.set_x_1
+        assert self.knowledge_base.boundary_region("R", category) == self.set_x_1